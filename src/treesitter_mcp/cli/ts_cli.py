@@ -1,13 +1,21 @@
 """Command-line interface for Tree-sitter analysis tools."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any
 import argparse
+import os
 import sys
 
 import orjson
 
+from ..core.language_manager import read_source
+from ..core.models import AnalysisResult
 from ..server import (
+    get_analyzer,
+    normalize_path,
+    write_output_file,
     treesitter_analyze_file,
+    treesitter_analyze_full,
     treesitter_get_ast,
     treesitter_get_call_graph,
     treesitter_find_function,
@@ -25,8 +33,10 @@ from ..server import (
 
 def _print_json(data: Any) -> None:
     """Serialize data as pretty JSON to stdout."""
-    json_bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2)
-    sys.stdout.buffer.write(json_bytes + b"\n")
+    json_bytes = orjson.dumps(
+        data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+    )
+    sys.stdout.buffer.write(json_bytes)
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -41,7 +51,10 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "file",
         nargs="?",
-        help="Path to the source file to analyze",
+        help=(
+            "Path to the source file to analyze, or a directory to analyze "
+            "every supported file in it"
+        ),
     )
 
     actions = parser.add_mutually_exclusive_group()
@@ -50,6 +63,11 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Output the full AST",
     )
+    actions.add_argument(
+        "--full",
+        action="store_true",
+        help="Output symbols, call graph and dependencies together",
+    )
     actions.add_argument(
         "--call-graph",
         action="store_true",
@@ -134,6 +152,16 @@ def _build_parser() -> argparse.ArgumentParser:
         type=str,
         help="Write results to a file instead of stdout",
     )
+    parser.add_argument(
+        "--recursive",
+        action="store_true",
+        help="Include subdirectories when analyzing a directory",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Files to analyze in parallel in directory mode (default: CPU count)",
+    )
 
     return parser
 
@@ -149,6 +177,8 @@ def _resolve_action(args: argparse.Namespace) -> Optional[str]:
     """
     if args.ast:
         return "ast"
+    if args.full:
+        return "full"
     if args.call_graph:
         return "call_graph"
     if args.find_function:
@@ -195,6 +225,16 @@ def _validate_args(
     if args.language and action not in {"find_usage", "query"}:
         parser.error("--language only works with --find-usage or --query")
 
+    is_directory = bool(args.file) and os.path.isdir(normalize_path(args.file))
+    if is_directory and action is not None:
+        parser.error("directories can only be used with the default analysis")
+
+    if (args.recursive or args.jobs is not None) and not is_directory:
+        parser.error("--recursive and --jobs only work when file is a directory")
+
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
     if args.max_depth is not None and action not in {
         "ast",
         "node_at_point",
@@ -222,6 +262,86 @@ def _handle_result(result: Any) -> int:
     return 0
 
 
+def _collect_files(directory: str, recursive: bool) -> List[str]:
+    """List supported source files in a directory.
+
+    Args:
+        directory: Directory to scan.
+        recursive: Whether to descend into subdirectories.
+
+    Returns:
+        Sorted list of file paths with a supported extension.
+    """
+    files: List[str] = []
+    pending = [directory]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        pending.append(entry.path)
+                elif entry.is_file() and get_analyzer(entry.path) is not None:
+                    files.append(entry.path)
+    files.sort()
+    return files
+
+
+def _analyze_path(file_path: str) -> Dict[str, Any]:
+    """Extract symbols from one file for directory mode.
+
+    The file is parsed and analyzed directly, so batch runs fill neither the
+    tree cache nor the analyzers' per-tree caches.
+
+    Args:
+        file_path: Path to a supported source file.
+
+    Returns:
+        Analysis result dictionary, or an error dictionary for this file.
+    """
+    try:
+        analyzer = get_analyzer(file_path)
+        code = read_source(file_path)
+        symbols = analyzer.extract_symbols(analyzer.parse(code).root_node, file_path)
+        return AnalysisResult(
+            file_path=file_path,
+            language=analyzer.get_language_name(),
+            symbols=symbols,
+        ).model_dump(exclude={"ast"})
+    except Exception as e:
+        return {"file_path": file_path, "error": f"Error analyzing file: {str(e)}"}
+
+
+def _analyze_directory(
+    directory: str,
+    recursive: bool = False,
+    jobs: Optional[int] = None,
+    output_file: Optional[str] = None,
+) -> Any:
+    """Analyze every supported file in a directory using a thread pool.
+
+    Tree-sitter releases the GIL while parsing, so files parse in parallel.
+
+    Args:
+        directory: Directory to scan.
+        recursive: Whether to descend into subdirectories.
+        jobs: Number of worker threads (defaults to the CPU count).
+        output_file: If provided, writes the results to this file instead.
+
+    Returns:
+        List of per-file analysis results, in path order.
+    """
+    directory = normalize_path(directory)
+    files = _collect_files(directory, recursive)
+    workers = jobs or os.cpu_count() or 1
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_analyze_path, files))
+
+    if output_file:
+        return write_output_file(output_file, results)
+    return results
+
+
 def _dispatch_action(action: Optional[str], args: argparse.Namespace) -> Any:
     """Dispatch the selected CLI action to the tool implementation.
 
@@ -232,6 +352,14 @@ def _dispatch_action(action: Optional[str], args: argparse.Namespace) -> Any:
     Returns:
         Tool result payload.
     """
+    if action is None and os.path.isdir(normalize_path(args.file)):
+        return _analyze_directory(
+            args.file,
+            recursive=args.recursive,
+            jobs=args.jobs,
+            output_file=args.output_file,
+        )
+
     if action is None:
         return treesitter_analyze_file(
             file_path=args.file, output_file=args.output_file
@@ -245,6 +373,11 @@ def _dispatch_action(action: Optional[str], args: argparse.Namespace) -> Any:
             kwargs["output_file"] = args.output_file
         return treesitter_get_ast(**kwargs)
 
+    if action == "full":
+        return treesitter_analyze_full(
+            file_path=args.file, output_file=args.output_file
+        )
+
     if action == "call_graph":
         return treesitter_get_call_graph(
             file_path=args.file, output_file=args.output_file
@@ -1,12 +1,46 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-from tree_sitter import Node, Tree
-from .models import AnalysisResult, ASTNode, Point, Symbol, CallGraph, SearchResult
+from typing import Callable, List, Dict, Any, Optional, Tuple
+from tree_sitter import Node, QueryCursor, Tree
+from .models import (
+    AnalysisResult,
+    ASTNode,
+    FastASTNode,
+    FullAnalysisResult,
+    Point,
+    Symbol,
+    CallGraph,
+    SearchResult,
+)
+
+def _make_fast_node(
+    node: Node, code: bytes, field_name: Optional[str], children: List[FastASTNode]
+) -> FastASTNode:
+    """Create a FastASTNode; leaves carry their source text."""
+    start = node.start_point
+    end = node.end_point
+    text = None
+    if not children:
+        raw = code[node.start_byte : node.end_byte]
+        text = raw.decode("utf-8", errors="replace") if raw else None
+    return FastASTNode(
+        node.type,
+        start[0],
+        start[1],
+        end[0],
+        end[1],
+        children,
+        field_name,
+        text,
+        node.id,
+    )
 
 
 class BaseAnalyzer(ABC):
     """Abstract base class for language-specific analyzers."""
 
+    # Node types that find_usage treats as references to a name
+    usage_node_types: Tuple[str, ...] = ("identifier",)
+
     def __init__(self, language_manager):
         """Initialize the analyzer with a language manager.
 
@@ -20,30 +54,34 @@ class BaseAnalyzer(ABC):
         """Get the unique name of the language (e.g., 'python', 'c')."""
         pass
 
-    def parse(self, code: str) -> Tree:
+    def parse(self, code: bytes) -> Tree:
         """Parse source code into a Tree-sitter tree.
 
         Args:
-            code: Source code as string
+            code: Source code as UTF-8 bytes
 
         Returns:
             Tree-sitter Tree object
         """
         parser = self.language_manager.get_parser(self.get_language_name())
-        return parser.parse(bytes(code, "utf8"))
+        return parser.parse(code)
 
-    def analyze(self, file_path: str, code: str) -> AnalysisResult:
+    def analyze(
+        self, file_path: str, code: bytes, tree: Optional[Tree] = None
+    ) -> AnalysisResult:
         """Perform comprehensive analysis on the code.
 
         Args:
             file_path: Path to the file
             code: Source code content
+            tree: Previously parsed tree for ``code``; parsed on demand if omitted
 
         Returns:
             AnalysisResult containing AST, symbols, etc.
         """
-        tree = self.parse(code)
-        ast = self._build_ast(tree.root_node, code)
+        if tree is None:
+            tree = self.parse(code)
+        ast = ASTNode.from_fast(self._build_ast(tree.root_node, code))
         symbols = self.extract_symbols(tree.root_node, file_path)
 
         return AnalysisResult(
@@ -53,40 +91,201 @@ class BaseAnalyzer(ABC):
             symbols=symbols,
         )
 
+    def analyze_symbols_only(
+        self, file_path: str, code: bytes, tree: Optional[Tree] = None
+    ) -> AnalysisResult:
+        """Extract symbols without building the AST.
+
+        Args:
+            file_path: Path to the file
+            code: Source code content
+            tree: Previously parsed tree for ``code``; parsed on demand if omitted.
+                Only a tree from ``LanguageManager.get_tree`` has its symbols
+                cached; one-shot callers can omit it to cache nothing.
+
+        Returns:
+            AnalysisResult with symbols and ``ast`` left unset
+        """
+        if tree is None:
+            tree = self.parse(code)
+        symbols = self.cached_symbols(tree.root_node, file_path)
+
+        return AnalysisResult(
+            file_path=file_path,
+            language=self.get_language_name(),
+            symbols=symbols,
+        )
+
+    def cached_symbols(self, root_node: Node, file_path: str) -> List[Symbol]:
+        """Return ``extract_symbols`` for the tree, computed once per tree.
+
+        The returned list is shared between callers and must not be modified.
+        """
+        return self._get_derived(
+            "symbols",
+            root_node,
+            file_path,
+            lambda: self.extract_symbols(root_node, file_path),
+        )
+
+    def cached_call_graph(self, root_node: Node, file_path: str) -> CallGraph:
+        """Return ``get_call_graph`` for the tree, computed once per tree."""
+        return self._get_derived(
+            "call_graph",
+            root_node,
+            file_path,
+            lambda: self.get_call_graph(root_node, file_path),
+        )
+
+    def cached_dependencies(self, root_node: Node, file_path: str) -> List[str]:
+        """Return ``get_dependencies`` for the tree, computed once per tree.
+
+        The returned list is shared between callers and must not be modified.
+        """
+        return self._get_derived(
+            "dependencies",
+            root_node,
+            file_path,
+            lambda: self.get_dependencies(root_node, file_path),
+        )
+
+    def analyze_full(self, root_node: Node, file_path: str) -> FullAnalysisResult:
+        """Return symbols, call graph and dependencies as one cached aggregate.
+
+        The three analyses still run as separate passes; each part comes from
+        the per-tree cache that also serves the individual tools, so nothing
+        computed by an earlier call on the unchanged tree is recomputed.
+
+        Args:
+            root_node: Root node of the parsed tree
+            file_path: Path to the file
+
+        Returns:
+            FullAnalysisResult combining the three analyses
+        """
+        return self._get_derived(
+            "full",
+            root_node,
+            file_path,
+            lambda: FullAnalysisResult(
+                file_path=file_path,
+                language=self.get_language_name(),
+                symbols=self.cached_symbols(root_node, file_path),
+                call_graph=self.cached_call_graph(root_node, file_path),
+                dependencies=self.cached_dependencies(root_node, file_path),
+            ),
+        )
+
+    def _get_derived(
+        self, kind: str, root_node: Node, file_path: str, build: Callable[[], Any]
+    ) -> Any:
+        """Return a result derived from a tree, building it on first use.
+
+        Results are stored on the language manager's tree cache entry for the
+        file, so they are evicted together with the tree. Trees that are not
+        the file's currently cached tree are analyzed without caching.
+        """
+        results = self.language_manager.get_derived_results(
+            file_path, self.get_language_name(), root_node
+        )
+        if results is None:
+            return build()
+        if kind not in results:
+            results.setdefault(kind, build())
+        return results[kind]
+
     def _build_ast(
         self,
         node: Node,
-        code: str,
+        code: bytes,
         depth: int = 0,
         max_depth: int = -1,
         field_name: Optional[str] = None,
-    ) -> ASTNode:
-        """Recursively build a simplified AST from the Tree-sitter tree."""
-        start = Point(row=node.start_point[0], column=node.start_point[1])
-        end = Point(row=node.end_point[0], column=node.end_point[1])
-
-        children: List[ASTNode] = []
-        if max_depth == -1 or depth < max_depth:
-            for idx, child in enumerate(node.children):
-                child_field_name = node.field_name_for_child(idx)
-                child_ast = self._build_ast(
-                    child, code, depth + 1, max_depth, field_name=child_field_name
-                )
-                children.append(child_ast)
-
-        text = None
-        if not children:
-            text = node.text.decode("utf-8") if node.text else None
-
-        return ASTNode(
-            type=node.type,
-            start_point=start,
-            end_point=end,
-            children=children,
-            field_name=field_name,
-            text=text,
-            id=node.id,
-        )
+    ) -> FastASTNode:
+        """Build a simplified AST from the Tree-sitter tree.
+
+        Walks the tree iteratively with a TreeCursor, so deeply nested sources
+        do not hit Python's recursion limit. Each node's children are collected
+        in a stack frame and the node is created once the cursor leaves it.
+        Returns FastASTNode records; use ``ASTNode.from_fast`` for a model.
+        """
+        if max_depth == -1:
+            return self._build_ast_unbounded(node, code, field_name)
+        return self._build_ast_bounded(node, code, depth, max_depth, field_name)
+
+    def _build_ast_unbounded(
+        self, node: Node, code: bytes, field_name: Optional[str] = None
+    ) -> FastASTNode:
+        """Build the full AST below ``node`` without any depth bookkeeping."""
+        make_node = _make_fast_node
+        cursor = node.walk()
+        goto_first_child = cursor.goto_first_child
+        goto_next_sibling = cursor.goto_next_sibling
+        goto_parent = cursor.goto_parent
+        # Open ancestors of the cursor position: (node, field_name, children)
+        stack: List[Tuple[Node, Optional[str], List[FastASTNode]]] = []
+        push = stack.append
+        pop = stack.pop
+        current_field = field_name
+
+        while True:
+            current = cursor.node
+            if goto_first_child():
+                push((current, current_field, []))
+                current_field = cursor.field_name
+                continue
+
+            finished = make_node(current, code, current_field, [])
+            while True:
+                if not stack:
+                    return finished
+                stack[-1][2].append(finished)
+                if goto_next_sibling():
+                    current_field = cursor.field_name
+                    break
+                goto_parent()
+                parent, parent_field, children = pop()
+                finished = make_node(parent, code, parent_field, children)
+
+    def _build_ast_bounded(
+        self,
+        node: Node,
+        code: bytes,
+        depth: int,
+        max_depth: int,
+        field_name: Optional[str] = None,
+    ) -> FastASTNode:
+        """Build the AST below ``node``, stopping at ``max_depth``."""
+        make_node = _make_fast_node
+        cursor = node.walk()
+        goto_first_child = cursor.goto_first_child
+        goto_next_sibling = cursor.goto_next_sibling
+        goto_parent = cursor.goto_parent
+        stack: List[Tuple[Node, Optional[str], List[FastASTNode]]] = []
+        push = stack.append
+        pop = stack.pop
+        current_field = field_name
+        # Number of open ancestors at which the cursor stops descending
+        max_open = max_depth - depth
+
+        while True:
+            current = cursor.node
+            if len(stack) < max_open and goto_first_child():
+                push((current, current_field, []))
+                current_field = cursor.field_name
+                continue
+
+            finished = make_node(current, code, current_field, [])
+            while True:
+                if not stack:
+                    return finished
+                stack[-1][2].append(finished)
+                if goto_next_sibling():
+                    current_field = cursor.field_name
+                    break
+                goto_parent()
+                parent, parent_field, children = pop()
+                finished = make_node(parent, code, parent_field, children)
 
     @abstractmethod
     def extract_symbols(self, root_node: Node, file_path: str) -> List[Symbol]:
@@ -108,10 +307,57 @@ class BaseAnalyzer(ABC):
         """Find variable declarations and usages by name."""
         pass
 
-    @abstractmethod
     def find_usage(self, root_node: Node, file_path: str, name: str) -> SearchResult:
-        """Find general usages of a symbol by name."""
-        pass
+        """Find general usages of a symbol by name.
+
+        Looks the name up in the tree's identifier index, so repeated lookups
+        on the same tree do not rescan it.
+        """
+        index = self._get_identifier_index(root_node, file_path)
+        matches = []
+        for node in index.get(name.encode("utf-8"), []):
+            start = node.start_point
+            end = node.end_point
+            matches.append(
+                Symbol(
+                    name=name,
+                    kind="usage",
+                    location={
+                        "start": Point(row=start[0], column=start[1]),
+                        "end": Point(row=end[0], column=end[1]),
+                    },
+                    file_path=file_path,
+                )
+            )
+        return SearchResult(query=name, matches=matches)
+
+    def _get_identifier_index(
+        self, root_node: Node, file_path: str
+    ) -> Dict[bytes, List[Node]]:
+        """Map each name to its ``usage_node_types`` nodes, in document order.
+
+        Built with one cursor walk per tree and cached alongside it. Names are
+        kept as raw UTF-8 slices of the source, so no per-node decode is needed.
+        """
+        node_types = frozenset(self.usage_node_types)
+
+        def build() -> Dict[bytes, List[Node]]:
+            index: Dict[bytes, List[Node]] = {}
+            source = root_node.text or b""
+            offset = root_node.start_byte
+            cursor = root_node.walk()
+            while True:
+                node = cursor.node
+                if node.type in node_types and node.is_named:
+                    name = source[node.start_byte - offset : node.end_byte - offset]
+                    index.setdefault(name, []).append(node)
+                if cursor.goto_first_child():
+                    continue
+                while not cursor.goto_next_sibling():
+                    if not cursor.goto_parent():
+                        return index
+
+        return self._get_derived("identifiers", root_node, file_path, build)
 
     @abstractmethod
     def get_dependencies(self, root_node: Node, file_path: str) -> List[str]:
@@ -120,25 +366,27 @@ class BaseAnalyzer(ABC):
 
     # Utility helpers for point/range navigation and cursor-style views
     def get_source_for_range(
-        self, code: str, start_row: int, start_col: int, end_row: int, end_col: int
+        self, code: bytes, start_row: int, start_col: int, end_row: int, end_col: int
     ) -> str:
         """Extract the source code text for a given line/column range.
 
         Args:
-            code: Source code as string
+            code: Source code as UTF-8 bytes
             start_row: Starting line number (0-based)
-            start_col: Starting column number (0-based)
+            start_col: Starting column byte offset (0-based)
             end_row: Ending line number (0-based)
-            end_col: Ending column number (0-based)
+            end_col: Ending column byte offset (0-based)
 
         Returns:
             The source code text covering the specified range
         """
-        lines = code.split("\n")
+        lines = code.split(b"\n")
 
         if start_row == end_row:
             if start_row < len(lines):
-                return lines[start_row][start_col:end_col]
+                return lines[start_row][start_col:end_col].decode(
+                    "utf-8", errors="replace"
+                )
             return ""
         else:
             result = []
@@ -152,7 +400,7 @@ class BaseAnalyzer(ABC):
             if end_row < len(lines):
                 result.append(lines[end_row][:end_col])
 
-            return "\n".join(result)
+            return b"\n".join(result).decode("utf-8", errors="replace")
 
     def _field_name_for_child(self, parent: Node, child: Node) -> Optional[str]:
         """Return the field name of a child relative to its parent, if available."""
@@ -162,41 +410,58 @@ class BaseAnalyzer(ABC):
         return None
 
     def build_node_at_point(
-        self, code: str, row: int, column: int, max_depth: int = 0
+        self,
+        code: bytes,
+        row: int,
+        column: int,
+        max_depth: int = 0,
+        tree: Optional[Tree] = None,
     ) -> ASTNode:
         """Return the AST node covering a specific point (row, col)."""
-        tree = self.parse(code)
+        if tree is None:
+            tree = self.parse(code)
         target = tree.root_node.descendant_for_point_range((row, column), (row, column))
-        return self._build_ast(target, code, max_depth=max_depth)
+        return ASTNode.from_fast(self._build_ast(target, code, max_depth=max_depth))
 
     def build_node_for_range(
         self,
-        code: str,
+        code: bytes,
         start_row: int,
         start_col: int,
         end_row: int,
         end_col: int,
         max_depth: int = 0,
+        tree: Optional[Tree] = None,
     ) -> ASTNode:
         """Return the smallest AST node covering a point range."""
-        tree = self.parse(code)
+        if tree is None:
+            tree = self.parse(code)
         target = tree.root_node.descendant_for_point_range(
             (start_row, start_col), (end_row, end_col)
         )
-        return self._build_ast(target, code, max_depth=max_depth)
+        return ASTNode.from_fast(self._build_ast(target, code, max_depth=max_depth))
 
     def build_cursor_view(
-        self, code: str, row: int, column: int, max_depth: int = 1
+        self,
+        code: bytes,
+        row: int,
+        column: int,
+        max_depth: int = 1,
+        tree: Optional[Tree] = None,
     ) -> Dict[str, Any]:
         """Return a compact cursor-style view around the node covering (row, col).
 
         Provides the focused node (limited depth), its ancestors, and nearby siblings.
         """
-        tree = self.parse(code)
+        if tree is None:
+            tree = self.parse(code)
         target = tree.root_node.descendant_for_point_range((row, column), (row, column))
 
         def to_summary(node: Node, parent: Optional[Node]) -> Dict[str, Any]:
             field_name = self._field_name_for_child(parent, node) if parent else None
+            return summarize(node, field_name)
+
+        def summarize(node: Node, field_name: Optional[str]) -> Dict[str, Any]:
             return {
                 "type": node.type,
                 "field_name": field_name,
@@ -208,7 +473,7 @@ class BaseAnalyzer(ABC):
                 "id": node.id,
             }
 
-        focus = self._build_ast(target, code, max_depth=max_depth)
+        focus = ASTNode.from_fast(self._build_ast(target, code, max_depth=max_depth))
 
         # Build ancestor chain
         ancestors: List[Dict[str, Any]] = []
@@ -235,7 +500,8 @@ class BaseAnalyzer(ABC):
 
         # Direct children (shallow summaries)
         children_summaries = [
-            to_summary(child_node, target) for child_node in target.children
+            summarize(child_node, target.field_name_for_child(idx))
+            for idx, child_node in enumerate(target.children)
         ]
 
         return {
@@ -246,30 +512,30 @@ class BaseAnalyzer(ABC):
         }
 
     def run_query(
-        self, query_str: str, root_node: Node, code: str
+        self, query_str: str, root_node: Node, code: bytes
     ) -> List[Dict[str, Any]]:
         """Run a custom Tree-sitter S-expression query."""
-        from tree_sitter import Query, QueryCursor
-
-        language = self.language_manager.get_language(self.get_language_name())
         try:
-            query = Query(language, query_str)
+            query = self.language_manager.get_query(
+                self.get_language_name(), query_str
+            )
             cursor = QueryCursor(query)
             captures = cursor.captures(root_node)
 
             results = []
             for capture_name, nodes in captures.items():
                 for node in nodes:
-                    start = Point(row=node.start_point[0], column=node.start_point[1])
-                    end = Point(row=node.end_point[0], column=node.end_point[1])
-
-                    text_content = node.text.decode("utf-8") if node.text else ""
+                    start = node.start_point
+                    end = node.end_point
+                    text_content = code[node.start_byte : node.end_byte].decode(
+                        "utf-8", errors="replace"
+                    )
                     results.append(
                         {
                             "capture_name": capture_name,
                             "text": text_content,
-                            "start": start.model_dump(),
-                            "end": end.model_dump(),
+                            "start": {"row": start[0], "column": start[1]},
+                            "end": {"row": end[0], "column": end[1]},
                             "type": node.type,
                         }
                     )
@@ -1,3 +1,9 @@
+import functools
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
 import tree_sitter_c
 import tree_sitter_cpp
 import tree_sitter_javascript
@@ -8,7 +14,161 @@ import tree_sitter_go
 import tree_sitter_java
 import tree_sitter_python
 import tree_sitter_ruby
-from tree_sitter import Language, Parser
+from tree_sitter import Language, Node, Parser, Query, Tree
+
+
+def read_source(file_path: str) -> bytes:
+    """Read a source file as bytes."""
+    with open(file_path, "rb") as f:
+        return f.read()
+
+
+# Chunk size for the linear scan that brackets the first difference
+_SCAN_CHUNK = 4096
+
+
+def _common_prefix_length(a: bytes, b: bytes) -> int:
+    """Return the length of the longest common prefix of two byte strings.
+
+    Whole chunks are compared first (plain ``bytes`` comparison is a memcmp),
+    then the first differing chunk is bisected.
+    """
+    limit = min(len(a), len(b))
+    lo = 0
+    while lo < limit and a[lo:lo + _SCAN_CHUNK] == b[lo:lo + _SCAN_CHUNK]:
+        lo += _SCAN_CHUNK
+    if lo >= limit:
+        return limit
+    base, hi = lo, min(lo + _SCAN_CHUNK, limit)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[base:mid] == b[base:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix_length(a: bytes, b: bytes, limit: int) -> int:
+    """Return the length of the longest common suffix, capped at ``limit`` bytes."""
+    len_a, len_b = len(a), len(b)
+    lo = 0
+    while lo < limit:
+        step = min(lo + _SCAN_CHUNK, limit)
+        if a[len_a - step:len_a - lo] != b[len_b - step:len_b - lo]:
+            break
+        lo = step
+    else:
+        return limit
+    base, hi = lo, min(lo + _SCAN_CHUNK, limit)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len_a - mid:len_a - base] == b[len_b - mid:len_b - base]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _point_at(
+    code: bytes, offset: int, base: int = 0, base_point: Tuple[int, int] = (0, 0)
+) -> Tuple[int, int]:
+    """Convert a byte offset into a (row, column) point.
+
+    Only ``code[base:offset]`` is scanned; ``base_point`` is the point at ``base``.
+    """
+    row = base_point[0] + code.count(b"\n", base, offset)
+    newline = code.rfind(b"\n", base, offset)
+    if newline < 0:
+        return row, base_point[1] + offset - base
+    return row, offset - (newline + 1)
+
+
+def compute_edit(old_code: bytes, new_code: bytes) -> Optional[Dict[str, Any]]:
+    """Describe the change between two sources as a single Tree-sitter edit.
+
+    The edited region spans from the first differing byte to the start of the
+    common suffix, which is exact for the typical single-range change.
+
+    Args:
+        old_code: Source the existing tree was parsed from
+        new_code: Updated source
+
+    Returns:
+        Keyword arguments for ``Tree.edit``, or None if the sources are identical
+    """
+    if old_code == new_code:
+        return None
+    start = _common_prefix_length(old_code, new_code)
+    suffix = _common_suffix_length(
+        old_code, new_code, min(len(old_code), len(new_code)) - start
+    )
+    old_end = len(old_code) - suffix
+    new_end = len(new_code) - suffix
+    start_point = _point_at(old_code, start)
+    return {
+        "start_byte": start,
+        "old_end_byte": old_end,
+        "new_end_byte": new_end,
+        "start_point": start_point,
+        "old_end_point": _point_at(old_code, old_end, start, start_point),
+        "new_end_point": _point_at(new_code, new_end, start, start_point),
+    }
+
+
+class TreeCache:
+    """LRU cache of parsed trees keyed by file path and language.
+
+    Each entry remembers the file's ``st_mtime_ns`` and ``st_size`` so a
+    changed file is detected without re-reading it, and carries a dict of
+    results analyzers derived from the tree, which is evicted with it. Access is
+    guarded by a lock because concurrent tool calls share one cache.
+    """
+
+    def __init__(self, capacity: int = 128):
+        """Initialize an empty cache holding at most ``capacity`` trees."""
+        self.capacity = capacity
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[int, int, bytes, Tree, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str], mtime_ns: int, size: int) -> Optional[Tuple[bytes, Tree]]:
+        """Return the cached ``(code, tree)`` if the file is unchanged."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != mtime_ns or entry[1] != size:
+                return None
+            self._entries.move_to_end(key)
+            return entry[2], entry[3]
+
+    def get_stale(self, key: Tuple[str, str]) -> Optional[Tuple[bytes, Tree]]:
+        """Return the last ``(code, tree)`` stored for ``key``, even if outdated."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return entry[2], entry[3]
+
+    def derived(self, key: Tuple[str, str], root_node: Node) -> Optional[Dict[str, Any]]:
+        """Return the derived-results dict for ``key`` if it holds ``root_node``'s tree."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry[3].root_node != root_node:
+            return None
+        return entry[4]
+
+    def put(self, key: Tuple[str, str], mtime_ns: int, size: int, code: bytes, tree: Tree) -> None:
+        """Store a parsed tree, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (mtime_ns, size, code, tree, {})
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached trees."""
+        with self._lock:
+            self._entries.clear()
+
 
 class LanguageManager:
     """Manages Tree-sitter languages and parsers."""
@@ -26,7 +186,10 @@ class LanguageManager:
             'python': Language(tree_sitter_python.language()),
             'ruby': Language(tree_sitter_ruby.language()),
         }
-        self._parsers = {}
+        # Parsers are not safe to share between threads, so each thread gets its own
+        self._local = threading.local()
+        self._tree_cache = TreeCache()
+        self._query_cache = functools.lru_cache(maxsize=256)(self._compile_query)
 
     def get_language(self, language_name: str) -> Language:
         """Get the Tree-sitter Language object for a given name."""
@@ -35,8 +198,77 @@ class LanguageManager:
         return self._languages[language_name]
 
     def get_parser(self, language_name: str) -> Parser:
-        """Get (or create) a Tree-sitter Parser for a given language."""
-        if language_name not in self._parsers:
-            parser = Parser(self.get_language(language_name))
-            self._parsers[language_name] = parser
-        return self._parsers[language_name]
+        """Get (or create) the calling thread's Tree-sitter Parser for a language."""
+        parsers = getattr(self._local, "parsers", None)
+        if parsers is None:
+            parsers = self._local.parsers = {}
+        parser = parsers.get(language_name)
+        if parser is None:
+            parser = parsers[language_name] = Parser(self.get_language(language_name))
+        return parser
+
+    def get_query(self, language_name: str, query_str: str) -> Query:
+        """Get a compiled Tree-sitter Query, reusing earlier compilations."""
+        return self._query_cache(language_name, query_str)
+
+    def _compile_query(self, language_name: str, query_str: str) -> Query:
+        """Compile a query for a language (uncached)."""
+        return Query(self.get_language(language_name), query_str)
+
+    def get_tree(self, file_path: str, language_name: str) -> Tuple[bytes, Tree]:
+        """Read and parse a file, reusing the cached tree if the file is unchanged.
+
+        When an older version of the file is cached, the previous tree is edited
+        and handed to the parser so unchanged subtrees are reused.
+
+        Args:
+            file_path: Absolute path to the source file
+            language_name: Language used to parse the file
+
+        Returns:
+            Tuple of (source bytes, Tree-sitter Tree)
+        """
+        stat = os.stat(file_path)
+        key = (file_path, language_name)
+        cached = self._tree_cache.get(key, stat.st_mtime_ns, stat.st_size)
+        if cached is not None:
+            return cached
+
+        code = read_source(file_path)
+        tree = self._reparse(self._tree_cache.get_stale(key), code, language_name)
+        self._tree_cache.put(key, stat.st_mtime_ns, stat.st_size, code, tree)
+        return code, tree
+
+    def get_derived_results(
+        self, file_path: str, language_name: str, root_node: Node
+    ) -> Optional[Dict[str, Any]]:
+        """Return the per-tree results dict stored alongside a cached tree.
+
+        Args:
+            file_path: Path the tree was cached under by ``get_tree``
+            language_name: Language the tree was parsed with
+            root_node: Root node of the tree the results belong to
+
+        Returns:
+            Mutable dict evicted together with the tree, or None if ``root_node``
+            does not belong to the currently cached tree for the file
+        """
+        return self._tree_cache.derived((file_path, language_name), root_node)
+
+    def _reparse(
+        self, previous: Optional[Tuple[bytes, Tree]], code: bytes, language_name: str
+    ) -> Tree:
+        """Parse ``code``, incrementally from ``previous`` when available."""
+        parser = self.get_parser(language_name)
+        if previous is not None:
+            old_code, old_tree = previous
+            try:
+                edit = compute_edit(old_code, code)
+                if edit is None:
+                    return old_tree
+                old_tree = old_tree.copy()
+                old_tree.edit(**edit)
+                return parser.parse(code, old_tree)
+            except Exception:
+                pass
+        return parser.parse(code)
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 
@@ -6,6 +7,52 @@ class Point(BaseModel):
     row: int
     column: int
 
+@dataclass(slots=True)
+class FastASTNode:
+    """Lightweight AST node used while walking the tree.
+
+    Converted to ``ASTNode`` only when a Pydantic model is needed.
+    """
+    type: str
+    start_row: int
+    start_col: int
+    end_row: int
+    end_col: int
+    children: List['FastASTNode']
+    field_name: Optional[str] = None
+    text: Optional[str] = None
+    id: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the tree to plain dicts, omitting empty and None fields.
+
+        Equivalent to ``ASTNode.model_dump(exclude_none=True,
+        exclude_defaults=True)`` without going through Pydantic.
+        """
+        built: Dict[int, Dict[str, Any]] = {}
+        stack = [(self, False)]
+        while stack:
+            current, expanded = stack.pop()
+            if not expanded:
+                stack.append((current, True))
+                stack.extend((child, False) for child in current.children)
+                continue
+            data: Dict[str, Any] = {
+                'type': current.type,
+                'start_point': {'row': current.start_row, 'column': current.start_col},
+                'end_point': {'row': current.end_row, 'column': current.end_col},
+            }
+            if current.children:
+                data['children'] = [built.pop(id(child)) for child in current.children]
+            if current.field_name is not None:
+                data['field_name'] = current.field_name
+            if current.text is not None:
+                data['text'] = current.text
+            if current.id is not None:
+                data['id'] = current.id
+            built[id(current)] = data
+        return built[id(self)]
+
 class ASTNode(BaseModel):
     """Represents a node in the Abstract Syntax Tree."""
     type: str
@@ -16,6 +63,31 @@ class ASTNode(BaseModel):
     text: Optional[str] = None
     id: Optional[int] = None
 
+    @classmethod
+    def from_fast(cls, node: FastASTNode) -> 'ASTNode':
+        """Build an ASTNode tree from a FastASTNode tree.
+
+        The input was produced from a parsed tree, so validation is skipped.
+        """
+        built: Dict[int, 'ASTNode'] = {}
+        stack = [(node, False)]
+        while stack:
+            current, expanded = stack.pop()
+            if not expanded:
+                stack.append((current, True))
+                stack.extend((child, False) for child in current.children)
+                continue
+            built[id(current)] = cls.model_construct(
+                type=current.type,
+                start_point=Point.model_construct(row=current.start_row, column=current.start_col),
+                end_point=Point.model_construct(row=current.end_row, column=current.end_col),
+                children=[built.pop(id(child)) for child in current.children],
+                field_name=current.field_name,
+                text=current.text,
+                id=current.id,
+            )
+        return built[id(node)]
+
 class Symbol(BaseModel):
     """Represents an extracted symbol (function, class, variable)."""
     name: str
@@ -27,7 +99,7 @@ class AnalysisResult(BaseModel):
     """Result of a comprehensive file analysis."""
     file_path: str
     language: str
-    ast: ASTNode
+    ast: Optional[ASTNode] = None
     symbols: List[Symbol]
     errors: List[str] = Field(default_factory=list)
 
@@ -41,6 +113,14 @@ class CallGraph(BaseModel):
     """Represents the call graph of a file."""
     nodes: List[CallGraphNode]
 
+class FullAnalysisResult(BaseModel):
+    """Symbols, call graph and dependencies of a file from a single parse."""
+    file_path: str
+    language: str
+    symbols: List[Symbol]
+    call_graph: CallGraph
+    dependencies: List[str]
+
 class SearchResult(BaseModel):
     """Result of a search operation."""
     query: str
@@ -9,7 +9,6 @@ class CAnalyzer(BaseAnalyzer):
 
     def extract_symbols(self, root_node: Node, file_path: str) -> List[Symbol]:
         symbols = []
-        language = self.language_manager.get_language('c')
         
         query_scm = """
         (function_definition
@@ -18,7 +17,7 @@ class CAnalyzer(BaseAnalyzer):
         (struct_specifier
           name: (type_identifier) @struct.name) @struct.def
         """
-        query = Query(language, query_scm)
+        query = self.language_manager.get_query('c', query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
         
@@ -52,7 +51,6 @@ class CAnalyzer(BaseAnalyzer):
 
     def get_call_graph(self, root_node: Node, file_path: str) -> CallGraph:
         nodes = []
-        language = self.language_manager.get_language('c')
         
         # Find all function definitions
         func_query_scm = """
@@ -60,7 +58,7 @@ class CAnalyzer(BaseAnalyzer):
           declarator: (function_declarator
             declarator: (identifier) @function.name)) @function.def
         """
-        func_query = Query(language, func_query_scm)
+        func_query = self.language_manager.get_query('c', func_query_scm)
         func_cursor = QueryCursor(func_query)
         func_captures = func_cursor.captures(root_node)
         
@@ -89,7 +87,7 @@ class CAnalyzer(BaseAnalyzer):
                 (call_expression
                   function: (identifier) @call.name)
                 """
-                call_query = Query(language, call_query_scm)
+                call_query = self.language_manager.get_query('c', call_query_scm)
                 call_cursor = QueryCursor(call_query)
                 call_captures = call_cursor.captures(func_node)
 
@@ -110,7 +108,6 @@ class CAnalyzer(BaseAnalyzer):
 
     def find_function(self, root_node: Node, file_path: str, name: str) -> SearchResult:
         matches = []
-        language = self.language_manager.get_language('c')
         
         query_scm = """
         (function_definition
@@ -119,7 +116,7 @@ class CAnalyzer(BaseAnalyzer):
             (#eq? @function.name "{name}"))) @function.def
         """.format(name=name)
         
-        query = Query(language, query_scm)
+        query = Query(self.language_manager.get_language('c'), query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
         
@@ -133,7 +130,6 @@ class CAnalyzer(BaseAnalyzer):
 
     def find_variable(self, root_node: Node, file_path: str, name: str) -> SearchResult:
         matches = []
-        language = self.language_manager.get_language('c')
         
         # Search for declarations and assignments
         query_scm = """
@@ -151,7 +147,7 @@ class CAnalyzer(BaseAnalyzer):
           (#eq? @var.name "{name}")) @var.use
         """.format(name=name)
         
-        query = Query(language, query_scm)
+        query = Query(self.language_manager.get_language('c'), query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
         
@@ -164,38 +160,15 @@ class CAnalyzer(BaseAnalyzer):
                 
         return SearchResult(query=name, matches=matches)
 
-    def find_usage(self, root_node: Node, file_path: str, name: str) -> SearchResult:
-        matches = []
-        language = self.language_manager.get_language('c')
-        
-        query_scm = """
-        (identifier) @usage
-        """
-        
-        query = Query(language, query_scm)
-        cursor = QueryCursor(query)
-        captures = cursor.captures(root_node)
-        
-        if 'usage' in captures:
-            for node in captures['usage']:
-                if node.text.decode('utf8') != name:
-                    continue
-                start = Point(row=node.start_point[0], column=node.start_point[1])
-                end = Point(row=node.end_point[0], column=node.end_point[1])
-                matches.append(Symbol(name=name, kind='usage', location={'start': start, 'end': end}, file_path=file_path))
-                
-        return SearchResult(query=name, matches=matches)
-
     def get_dependencies(self, root_node: Node, file_path: str) -> List[str]:
         dependencies = []
-        language = self.language_manager.get_language('c')
         
         query_scm = """
         (preproc_include
           path: (_) @path)
         """
         
-        query = Query(language, query_scm)
+        query = self.language_manager.get_query('c', query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
         
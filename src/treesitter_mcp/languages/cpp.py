@@ -9,7 +9,6 @@ class CppAnalyzer(BaseAnalyzer):
 
     def extract_symbols(self, root_node: Node, file_path: str) -> List[Symbol]:
         symbols = []
-        language = self.language_manager.get_language('cpp')
 
         query_scm = """
         (function_definition
@@ -21,7 +20,7 @@ class CppAnalyzer(BaseAnalyzer):
         (class_specifier
           name: (type_identifier) @class.name) @class.def
         """
-        query = Query(language, query_scm)
+        query = self.language_manager.get_query('cpp', query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -50,7 +49,6 @@ class CppAnalyzer(BaseAnalyzer):
 
     def get_call_graph(self, root_node: Node, file_path: str) -> CallGraph:
         nodes = []
-        language = self.language_manager.get_language('cpp')
 
         func_query_scm = """
         (function_definition
@@ -60,7 +58,7 @@ class CppAnalyzer(BaseAnalyzer):
           declarator: (function_declarator
             declarator: (field_identifier) @field.name)) @function.def
         """
-        func_query = Query(language, func_query_scm)
+        func_query = self.language_manager.get_query('cpp', func_query_scm)
         func_cursor = QueryCursor(func_query)
         func_captures = func_cursor.captures(root_node)
 
@@ -86,7 +84,7 @@ class CppAnalyzer(BaseAnalyzer):
                       function: (field_expression
                         field: (field_identifier) @call.method))
                     """
-                    call_query = Query(language, call_query_scm)
+                    call_query = self.language_manager.get_query('cpp', call_query_scm)
                     call_cursor = QueryCursor(call_query)
                     call_captures = call_cursor.captures(func_node)
 
@@ -110,7 +108,6 @@ class CppAnalyzer(BaseAnalyzer):
 
     def find_function(self, root_node: Node, file_path: str, name: str) -> SearchResult:
         matches = []
-        language = self.language_manager.get_language('cpp')
 
         query_scm = """
         (function_definition
@@ -123,7 +120,7 @@ class CppAnalyzer(BaseAnalyzer):
             (#eq? @field.name "{name}"))) @function.def
         """.format(name=name)
 
-        query = Query(language, query_scm)
+        query = Query(self.language_manager.get_language('cpp'), query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -138,7 +135,6 @@ class CppAnalyzer(BaseAnalyzer):
 
     def find_variable(self, root_node: Node, file_path: str, name: str) -> SearchResult:
         matches = []
-        language = self.language_manager.get_language('cpp')
         
         query_scm = """
         (declaration
@@ -155,7 +151,7 @@ class CppAnalyzer(BaseAnalyzer):
           (#eq? @var.name "{name}")) @var.use
         """.format(name=name)
         
-        query = Query(language, query_scm)
+        query = Query(self.language_manager.get_language('cpp'), query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
         
@@ -168,38 +164,15 @@ class CppAnalyzer(BaseAnalyzer):
                 
         return SearchResult(query=name, matches=matches)
 
-    def find_usage(self, root_node: Node, file_path: str, name: str) -> SearchResult:
-        matches = []
-        language = self.language_manager.get_language('cpp')
-        
-        query_scm = """
-        (identifier) @usage
-        """
-        
-        query = Query(language, query_scm)
-        cursor = QueryCursor(query)
-        captures = cursor.captures(root_node)
-        
-        for capture_name, nodes in captures.items():
-            for node in nodes:
-                if node.text.decode('utf8') != name:
-                    continue
-                start = Point(row=node.start_point[0], column=node.start_point[1])
-                end = Point(row=node.end_point[0], column=node.end_point[1])
-                matches.append(Symbol(name=name, kind='usage', location={'start': start, 'end': end}, file_path=file_path))
-                
-        return SearchResult(query=name, matches=matches)
-
     def get_dependencies(self, root_node: Node, file_path: str) -> List[str]:
         dependencies = []
-        language = self.language_manager.get_language('cpp')
         
         query_scm = """
         (preproc_include
           path: (_) @path)
         """
         
-        query = Query(language, query_scm)
+        query = self.language_manager.get_query('cpp', query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
         
@@ -10,7 +10,6 @@ class GoAnalyzer(BaseAnalyzer):
 
     def extract_symbols(self, root_node: Node, file_path: str) -> List[Symbol]:
         symbols = []
-        language = self.language_manager.get_language('go')
 
         query_scm = """
         (function_declaration
@@ -24,7 +23,7 @@ class GoAnalyzer(BaseAnalyzer):
           name: (type_identifier) @type.name
           type: (interface_type)) @interface.def
         """
-        query = Query(language, query_scm)
+        query = self.language_manager.get_query('go', query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -55,7 +54,6 @@ class GoAnalyzer(BaseAnalyzer):
 
     def get_call_graph(self, root_node: Node, file_path: str) -> CallGraph:
         nodes = []
-        language = self.language_manager.get_language('go')
 
         func_query_scm = """
         (function_declaration
@@ -63,7 +61,7 @@ class GoAnalyzer(BaseAnalyzer):
         (method_declaration
           name: (field_identifier) @method.name) @method.def
         """
-        func_query = Query(language, func_query_scm)
+        func_query = self.language_manager.get_query('go', func_query_scm)
         func_cursor = QueryCursor(func_query)
         func_captures = func_cursor.captures(root_node)
 
@@ -85,7 +83,7 @@ class GoAnalyzer(BaseAnalyzer):
                   function: (selector_expression
                     field: (field_identifier) @call.method))
                 """
-                call_query = Query(language, call_query_scm)
+                call_query = self.language_manager.get_query('go', call_query_scm)
                 call_cursor = QueryCursor(call_query)
                 call_captures = call_cursor.captures(func_node)
 
@@ -103,7 +101,6 @@ class GoAnalyzer(BaseAnalyzer):
 
     def find_function(self, root_node: Node, file_path: str, name: str) -> SearchResult:
         matches = []
-        language = self.language_manager.get_language('go')
 
         query_scm = """
         (function_declaration
@@ -114,7 +111,7 @@ class GoAnalyzer(BaseAnalyzer):
           (#eq? @method.name "{name}")) @method.def
         """.format(name=name)
 
-        query = Query(language, query_scm)
+        query = Query(self.language_manager.get_language('go'), query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -128,7 +125,6 @@ class GoAnalyzer(BaseAnalyzer):
 
     def find_variable(self, root_node: Node, file_path: str, name: str) -> SearchResult:
         matches = []
-        language = self.language_manager.get_language('go')
 
         query_scm = """
         (short_var_declaration
@@ -151,7 +147,7 @@ class GoAnalyzer(BaseAnalyzer):
 
         (identifier) @var.use
         """
-        query = Query(language, query_scm.format(name=name))
+        query = Query(self.language_manager.get_language('go'), query_scm.format(name=name))
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -167,31 +163,8 @@ class GoAnalyzer(BaseAnalyzer):
 
         return SearchResult(query=name, matches=matches)
 
-    def find_usage(self, root_node: Node, file_path: str, name: str) -> SearchResult:
-        matches = []
-        language = self.language_manager.get_language('go')
-
-        query_scm = """
-        (identifier) @usage
-        """
-
-        query = Query(language, query_scm)
-        cursor = QueryCursor(query)
-        captures = cursor.captures(root_node)
-
-        for _, nodes in captures.items():
-            for node in nodes:
-                if node.text.decode('utf8') != name:
-                    continue
-                start = Point(row=node.start_point[0], column=node.start_point[1])
-                end = Point(row=node.end_point[0], column=node.end_point[1])
-                matches.append(Symbol(name=name, kind='usage', location={'start': start, 'end': end}, file_path=file_path))
-
-        return SearchResult(query=name, matches=matches)
-
     def get_dependencies(self, root_node: Node, file_path: str) -> List[str]:
         dependencies = []
-        language = self.language_manager.get_language('go')
 
         query_scm = """
         (import_spec
@@ -200,7 +173,7 @@ class GoAnalyzer(BaseAnalyzer):
           path: (raw_string_literal) @path)
         """
 
-        query = Query(language, query_scm)
+        query = self.language_manager.get_query('go', query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -10,7 +10,6 @@ class JavaAnalyzer(BaseAnalyzer):
 
     def extract_symbols(self, root_node: Node, file_path: str) -> List[Symbol]:
         symbols = []
-        language = self.language_manager.get_language('java')
 
         query_scm = """
         (class_declaration
@@ -22,7 +21,7 @@ class JavaAnalyzer(BaseAnalyzer):
         (constructor_declaration
           name: (identifier) @ctor.name) @ctor.def
         """
-        query = Query(language, query_scm)
+        query = self.language_manager.get_query('java', query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -52,7 +51,6 @@ class JavaAnalyzer(BaseAnalyzer):
 
     def get_call_graph(self, root_node: Node, file_path: str) -> CallGraph:
         nodes = []
-        language = self.language_manager.get_language('java')
 
         func_query_scm = """
         (method_declaration
@@ -60,7 +58,7 @@ class JavaAnalyzer(BaseAnalyzer):
         (constructor_declaration
           name: (identifier) @ctor.name) @ctor.def
         """
-        func_query = Query(language, func_query_scm)
+        func_query = self.language_manager.get_query('java', func_query_scm)
         func_cursor = QueryCursor(func_query)
         func_captures = func_cursor.captures(root_node)
 
@@ -86,7 +84,7 @@ class JavaAnalyzer(BaseAnalyzer):
                   object: (identifier)
                   name: (identifier) @call.name)
                 """
-                call_query = Query(language, call_query_scm)
+                call_query = self.language_manager.get_query('java', call_query_scm)
                 call_cursor = QueryCursor(call_query)
                 call_captures = call_cursor.captures(func_node)
 
@@ -104,7 +102,6 @@ class JavaAnalyzer(BaseAnalyzer):
 
     def find_function(self, root_node: Node, file_path: str, name: str) -> SearchResult:
         matches = []
-        language = self.language_manager.get_language('java')
 
         query_scm = """
         (method_declaration
@@ -115,7 +112,7 @@ class JavaAnalyzer(BaseAnalyzer):
           (#eq? @ctor.name "{name}")) @ctor.def
         """.format(name=name)
 
-        query = Query(language, query_scm)
+        query = Query(self.language_manager.get_language('java'), query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -129,7 +126,6 @@ class JavaAnalyzer(BaseAnalyzer):
 
     def find_variable(self, root_node: Node, file_path: str, name: str) -> SearchResult:
         matches = []
-        language = self.language_manager.get_language('java')
 
         query_scm = """
         (local_variable_declaration
@@ -141,7 +137,7 @@ class JavaAnalyzer(BaseAnalyzer):
           left: (identifier) @var.name
           (#eq? @var.name "{name}")) @var.use
         """
-        query = Query(language, query_scm.format(name=name))
+        query = Query(self.language_manager.get_language('java'), query_scm.format(name=name))
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -157,31 +153,8 @@ class JavaAnalyzer(BaseAnalyzer):
 
         return SearchResult(query=name, matches=matches)
 
-    def find_usage(self, root_node: Node, file_path: str, name: str) -> SearchResult:
-        matches = []
-        language = self.language_manager.get_language('java')
-
-        query_scm = """
-        (identifier) @usage
-        """
-
-        query = Query(language, query_scm)
-        cursor = QueryCursor(query)
-        captures = cursor.captures(root_node)
-
-        for _, nodes in captures.items():
-            for node in nodes:
-                if node.text.decode('utf8') != name:
-                    continue
-                start = Point(row=node.start_point[0], column=node.start_point[1])
-                end = Point(row=node.end_point[0], column=node.end_point[1])
-                matches.append(Symbol(name=name, kind='usage', location={'start': start, 'end': end}, file_path=file_path))
-
-        return SearchResult(query=name, matches=matches)
-
     def get_dependencies(self, root_node: Node, file_path: str) -> List[str]:
         dependencies = []
-        language = self.language_manager.get_language('java')
 
         query_scm = """
         (import_declaration
@@ -191,7 +164,7 @@ class JavaAnalyzer(BaseAnalyzer):
           (asterisk))
         """
 
-        query = Query(language, query_scm)
+        query = self.language_manager.get_query('java', query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -10,7 +10,6 @@ class JavaScriptAnalyzer(BaseAnalyzer):
 
     def extract_symbols(self, root_node: Node, file_path: str) -> List[Symbol]:
         symbols = []
-        language = self.language_manager.get_language('javascript')
 
         query_scm = """
         (function_declaration
@@ -20,7 +19,7 @@ class JavaScriptAnalyzer(BaseAnalyzer):
         (method_definition
           name: (property_identifier) @method.name) @method.def
         """
-        query = Query(language, query_scm)
+        query = self.language_manager.get_query('javascript', query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -49,7 +48,6 @@ class JavaScriptAnalyzer(BaseAnalyzer):
 
     def get_call_graph(self, root_node: Node, file_path: str) -> CallGraph:
         nodes = []
-        language = self.language_manager.get_language('javascript')
 
         func_query_scm = """
         (function_declaration
@@ -57,7 +55,7 @@ class JavaScriptAnalyzer(BaseAnalyzer):
         (method_definition
           name: (property_identifier) @method.name) @method.def
         """
-        func_query = Query(language, func_query_scm)
+        func_query = self.language_manager.get_query('javascript', func_query_scm)
         func_cursor = QueryCursor(func_query)
         func_captures = func_cursor.captures(root_node)
 
@@ -79,7 +77,7 @@ class JavaScriptAnalyzer(BaseAnalyzer):
                   function: (member_expression
                     property: (property_identifier) @call.method))
                 """
-                call_query = Query(language, call_query_scm)
+                call_query = self.language_manager.get_query('javascript', call_query_scm)
                 call_cursor = QueryCursor(call_query)
                 call_captures = call_cursor.captures(func_node)
 
@@ -97,7 +95,6 @@ class JavaScriptAnalyzer(BaseAnalyzer):
 
     def find_function(self, root_node: Node, file_path: str, name: str) -> SearchResult:
         matches = []
-        language = self.language_manager.get_language('javascript')
 
         query_scm = """
         (function_declaration
@@ -108,7 +105,7 @@ class JavaScriptAnalyzer(BaseAnalyzer):
           (#eq? @method.name "{name}")) @method.def
         """.format(name=name)
 
-        query = Query(language, query_scm)
+        query = Query(self.language_manager.get_language('javascript'), query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -122,7 +119,6 @@ class JavaScriptAnalyzer(BaseAnalyzer):
 
     def find_variable(self, root_node: Node, file_path: str, name: str) -> SearchResult:
         matches = []
-        language = self.language_manager.get_language('javascript')
 
         query_scm = """
         (lexical_declaration
@@ -140,7 +136,7 @@ class JavaScriptAnalyzer(BaseAnalyzer):
           (#eq? @var.name "{name}")) @var.use
         """.format(name=name)
 
-        query = Query(language, query_scm)
+        query = Query(self.language_manager.get_language('javascript'), query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -153,31 +149,8 @@ class JavaScriptAnalyzer(BaseAnalyzer):
 
         return SearchResult(query=name, matches=matches)
 
-    def find_usage(self, root_node: Node, file_path: str, name: str) -> SearchResult:
-        matches = []
-        language = self.language_manager.get_language('javascript')
-
-        query_scm = """
-        (identifier) @usage
-        """
-
-        query = Query(language, query_scm)
-        cursor = QueryCursor(query)
-        captures = cursor.captures(root_node)
-
-        for capture_name, nodes in captures.items():
-            for node in nodes:
-                if node.text.decode('utf8') != name:
-                    continue
-                start = Point(row=node.start_point[0], column=node.start_point[1])
-                end = Point(row=node.end_point[0], column=node.end_point[1])
-                matches.append(Symbol(name=name, kind='usage', location={'start': start, 'end': end}, file_path=file_path))
-
-        return SearchResult(query=name, matches=matches)
-
     def get_dependencies(self, root_node: Node, file_path: str) -> List[str]:
         dependencies = []
-        language = self.language_manager.get_language('javascript')
 
         query_scm = """
         (import_statement
@@ -191,7 +164,7 @@ class JavaScriptAnalyzer(BaseAnalyzer):
           (#eq? @require.name "require"))
         """
 
-        query = Query(language, query_scm)
+        query = self.language_manager.get_query('javascript', query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
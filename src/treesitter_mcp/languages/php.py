@@ -5,12 +5,13 @@ from ..core.models import Symbol, Point, CallGraph, CallGraphNode, SearchResult
 
 
 class PhpAnalyzer(BaseAnalyzer):
+    usage_node_types = ('variable_name',)
+
     def get_language_name(self) -> str:
         return 'php'
 
     def extract_symbols(self, root_node: Node, file_path: str) -> List[Symbol]:
         symbols = []
-        language = self.language_manager.get_language('php')
 
         query_scm = """
         (function_definition
@@ -24,7 +25,7 @@ class PhpAnalyzer(BaseAnalyzer):
         (method_declaration
           name: (name) @method.name) @method.def
         """
-        query = Query(language, query_scm)
+        query = self.language_manager.get_query('php', query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -57,7 +58,6 @@ class PhpAnalyzer(BaseAnalyzer):
 
     def get_call_graph(self, root_node: Node, file_path: str) -> CallGraph:
         nodes = []
-        language = self.language_manager.get_language('php')
 
         func_query_scm = """
         (function_definition
@@ -65,7 +65,7 @@ class PhpAnalyzer(BaseAnalyzer):
         (method_declaration
           name: (name) @method.name) @method.def
         """
-        func_query = Query(language, func_query_scm)
+        func_query = self.language_manager.get_query('php', func_query_scm)
         func_cursor = QueryCursor(func_query)
         func_captures = func_cursor.captures(root_node)
 
@@ -88,7 +88,7 @@ class PhpAnalyzer(BaseAnalyzer):
                 (scoped_call_expression
                   name: (name) @call.method)
                 """
-                call_query = Query(language, call_query_scm)
+                call_query = self.language_manager.get_query('php', call_query_scm)
                 call_cursor = QueryCursor(call_query)
                 call_captures = call_cursor.captures(func_node)
 
@@ -106,7 +106,6 @@ class PhpAnalyzer(BaseAnalyzer):
 
     def find_function(self, root_node: Node, file_path: str, name: str) -> SearchResult:
         matches = []
-        language = self.language_manager.get_language('php')
 
         query_scm = """
         (function_definition
@@ -117,7 +116,7 @@ class PhpAnalyzer(BaseAnalyzer):
           (#eq? @method.name "{name}")) @method.def
         """.format(name=name)
 
-        query = Query(language, query_scm)
+        query = Query(self.language_manager.get_language('php'), query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -131,7 +130,6 @@ class PhpAnalyzer(BaseAnalyzer):
 
     def find_variable(self, root_node: Node, file_path: str, name: str) -> SearchResult:
         matches = []
-        language = self.language_manager.get_language('php')
 
         query_scm = """
         (simple_parameter
@@ -144,7 +142,7 @@ class PhpAnalyzer(BaseAnalyzer):
 
         (variable_name) @var.use
         """
-        query = Query(language, query_scm.format(name=name))
+        query = Query(self.language_manager.get_language('php'), query_scm.format(name=name))
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -160,31 +158,8 @@ class PhpAnalyzer(BaseAnalyzer):
 
         return SearchResult(query=name, matches=matches)
 
-    def find_usage(self, root_node: Node, file_path: str, name: str) -> SearchResult:
-        matches = []
-        language = self.language_manager.get_language('php')
-
-        query_scm = """
-        (variable_name) @usage
-        """
-
-        query = Query(language, query_scm)
-        cursor = QueryCursor(query)
-        captures = cursor.captures(root_node)
-
-        for _, nodes in captures.items():
-            for node in nodes:
-                if node.text.decode('utf8') != name:
-                    continue
-                start = Point(row=node.start_point[0], column=node.start_point[1])
-                end = Point(row=node.end_point[0], column=node.end_point[1])
-                matches.append(Symbol(name=name, kind='usage', location={'start': start, 'end': end}, file_path=file_path))
-
-        return SearchResult(query=name, matches=matches)
-
     def get_dependencies(self, root_node: Node, file_path: str) -> List[str]:
         dependencies = []
-        language = self.language_manager.get_language('php')
 
         query_scm = """
         (include_expression
@@ -205,7 +180,7 @@ class PhpAnalyzer(BaseAnalyzer):
           (name) @use.name)
         """
 
-        query = Query(language, query_scm)
+        query = self.language_manager.get_query('php', query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -9,7 +9,6 @@ class PythonAnalyzer(BaseAnalyzer):
 
     def extract_symbols(self, root_node: Node, file_path: str) -> List[Symbol]:
         symbols = []
-        language = self.language_manager.get_language('python')
         
         # Query for functions and classes
         query_scm = """
@@ -18,7 +17,7 @@ class PythonAnalyzer(BaseAnalyzer):
         (class_definition
           name: (identifier) @class.name) @class.def
         """
-        query = Query(language, query_scm)
+        query = self.language_manager.get_query('python', query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
         
@@ -45,14 +44,13 @@ class PythonAnalyzer(BaseAnalyzer):
     def get_call_graph(self, root_node: Node, file_path: str) -> CallGraph:
         """Build a call graph showing which functions call which other functions."""
         nodes = []
-        language = self.language_manager.get_language('python')
 
         # Find all function definitions
         func_query_scm = """
         (function_definition
           name: (identifier) @function.name) @function.def
         """
-        func_query = Query(language, func_query_scm)
+        func_query = self.language_manager.get_query('python', func_query_scm)
         func_cursor = QueryCursor(func_query)
         func_captures = func_cursor.captures(root_node)
 
@@ -73,7 +71,7 @@ class PythonAnalyzer(BaseAnalyzer):
                 (call
                   function: (identifier) @call.name)
                 """
-                call_query = Query(language, call_query_scm)
+                call_query = self.language_manager.get_query('python', call_query_scm)
                 call_cursor = QueryCursor(call_query)
                 call_captures = call_cursor.captures(func_node)
 
@@ -92,7 +90,6 @@ class PythonAnalyzer(BaseAnalyzer):
     def find_function(self, root_node: Node, file_path: str, name: str) -> SearchResult:
         """Find functions by name."""
         matches = []
-        language = self.language_manager.get_language('python')
 
         query_scm = """
         (function_definition
@@ -100,7 +97,7 @@ class PythonAnalyzer(BaseAnalyzer):
           (#eq? @function.name "{name}")) @function.def
         """.format(name=name)
 
-        query = Query(language, query_scm)
+        query = Query(self.language_manager.get_language('python'), query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -115,7 +112,6 @@ class PythonAnalyzer(BaseAnalyzer):
     def find_variable(self, root_node: Node, file_path: str, name: str) -> SearchResult:
         """Find variable definitions and usages."""
         matches = []
-        language = self.language_manager.get_language('python')
 
         # Search for assignments and identifiers
         query_scm = """
@@ -127,7 +123,7 @@ class PythonAnalyzer(BaseAnalyzer):
         (#eq? @identifier "{name}")
         """.format(name=name)
 
-        query = Query(language, query_scm)
+        query = Query(self.language_manager.get_language('python'), query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -140,31 +136,8 @@ class PythonAnalyzer(BaseAnalyzer):
 
         return SearchResult(query=name, matches=matches)
 
-    def find_usage(self, root_node: Node, file_path: str, name: str) -> SearchResult:
-        matches = []
-        language = self.language_manager.get_language('python')
-        
-        query_scm = """
-        (identifier) @usage
-        """
-        
-        query = Query(language, query_scm)
-        cursor = QueryCursor(query)
-        captures = cursor.captures(root_node)
-        
-        for capture_name, nodes in captures.items():
-            for node in nodes:
-                if node.text.decode('utf8') != name:
-                    continue
-                start = Point(row=node.start_point[0], column=node.start_point[1])
-                end = Point(row=node.end_point[0], column=node.end_point[1])
-                matches.append(Symbol(name=name, kind='usage', location={'start': start, 'end': end}, file_path=file_path))
-                
-        return SearchResult(query=name, matches=matches)
-
     def get_dependencies(self, root_node: Node, file_path: str) -> List[str]:
         dependencies = []
-        language = self.language_manager.get_language('python')
         
         query_scm = """
         (import_statement
@@ -176,7 +149,7 @@ class PythonAnalyzer(BaseAnalyzer):
           module_name: (dotted_name) @import)
         """
         
-        query = Query(language, query_scm)
+        query = self.language_manager.get_query('python', query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
         
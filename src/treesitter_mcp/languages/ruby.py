@@ -5,12 +5,13 @@ from ..core.models import Symbol, Point, CallGraph, CallGraphNode, SearchResult
 
 
 class RubyAnalyzer(BaseAnalyzer):
+    usage_node_types = ('identifier', 'constant')
+
     def get_language_name(self) -> str:
         return 'ruby'
 
     def extract_symbols(self, root_node: Node, file_path: str) -> List[Symbol]:
         symbols = []
-        language = self.language_manager.get_language('ruby')
 
         # Query for methods and classes
         query_scm = """
@@ -23,7 +24,7 @@ class RubyAnalyzer(BaseAnalyzer):
         (singleton_method
           name: (identifier) @singleton_method.name) @singleton_method.def
         """
-        query = Query(language, query_scm)
+        query = self.language_manager.get_query('ruby', query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -66,7 +67,6 @@ class RubyAnalyzer(BaseAnalyzer):
     def get_call_graph(self, root_node: Node, file_path: str) -> CallGraph:
         """Build a call graph showing which methods call which other methods."""
         nodes = []
-        language = self.language_manager.get_language('ruby')
 
         # First, find all method definitions
         method_names = set()
@@ -76,7 +76,7 @@ class RubyAnalyzer(BaseAnalyzer):
         (singleton_method
           name: (identifier) @singleton_method.name)
         """
-        method_query = Query(language, method_query_scm)
+        method_query = self.language_manager.get_query('ruby', method_query_scm)
         method_cursor = QueryCursor(method_query)
         method_captures = method_cursor.captures(root_node)
 
@@ -91,7 +91,7 @@ class RubyAnalyzer(BaseAnalyzer):
         (singleton_method
           name: (identifier) @method.name) @singleton_method.def
         """
-        func_query = Query(language, func_query_scm)
+        func_query = self.language_manager.get_query('ruby', func_query_scm)
         func_cursor = QueryCursor(func_query)
         func_captures = func_cursor.captures(root_node)
 
@@ -113,7 +113,7 @@ class RubyAnalyzer(BaseAnalyzer):
                 (call
                   method: (identifier) @call.name)
                 """
-                call_query = Query(language, call_query_scm)
+                call_query = self.language_manager.get_query('ruby', call_query_scm)
                 call_cursor = QueryCursor(call_query)
                 call_captures = call_cursor.captures(func_node)
 
@@ -129,7 +129,7 @@ class RubyAnalyzer(BaseAnalyzer):
                 identifier_query_scm = """
                 (identifier) @id
                 """
-                identifier_query = Query(language, identifier_query_scm)
+                identifier_query = self.language_manager.get_query('ruby', identifier_query_scm)
                 identifier_cursor = QueryCursor(identifier_query)
                 identifier_captures = identifier_cursor.captures(func_node)
 
@@ -168,7 +168,6 @@ class RubyAnalyzer(BaseAnalyzer):
     def find_function(self, root_node: Node, file_path: str, name: str) -> SearchResult:
         """Find methods by name."""
         matches = []
-        language = self.language_manager.get_language('ruby')
 
         query_scm = """
         (method
@@ -179,7 +178,7 @@ class RubyAnalyzer(BaseAnalyzer):
           (#eq? @method.name "{name}")) @singleton_method.def
         """.format(name=name)
 
-        query = Query(language, query_scm)
+        query = Query(self.language_manager.get_language('ruby'), query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -194,7 +193,6 @@ class RubyAnalyzer(BaseAnalyzer):
     def find_variable(self, root_node: Node, file_path: str, name: str) -> SearchResult:
         """Find variable definitions and usages."""
         matches = []
-        language = self.language_manager.get_language('ruby')
 
         # Check if this is an instance variable (starts with @)
         is_instance_var = name.startswith('@')
@@ -215,7 +213,7 @@ class RubyAnalyzer(BaseAnalyzer):
             (identifier) @identifier
             """
 
-        query = Query(language, query_scm)
+        query = self.language_manager.get_query('ruby', query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -249,41 +247,16 @@ class RubyAnalyzer(BaseAnalyzer):
 
         return SearchResult(query=name, matches=matches)
 
-    def find_usage(self, root_node: Node, file_path: str, name: str) -> SearchResult:
-        """Find all usages of an identifier."""
-        matches = []
-        language = self.language_manager.get_language('ruby')
-
-        query_scm = """
-        (identifier) @usage
-        (constant) @usage
-        """
-
-        query = Query(language, query_scm)
-        cursor = QueryCursor(query)
-        captures = cursor.captures(root_node)
-
-        for capture_name, nodes in captures.items():
-            for node in nodes:
-                text = node.text.decode('utf8')
-                if text == name:
-                    start = Point(row=node.start_point[0], column=node.start_point[1])
-                    end = Point(row=node.end_point[0], column=node.end_point[1])
-                    matches.append(Symbol(name=name, kind='usage', location={'start': start, 'end': end}, file_path=file_path))
-
-        return SearchResult(query=name, matches=matches)
-
     def get_dependencies(self, root_node: Node, file_path: str) -> List[str]:
         """Extract dependencies from require and require_relative statements."""
         dependencies = []
-        language = self.language_manager.get_language('ruby')
 
         # Find all call nodes
         query_scm = """
         (call) @call
         """
 
-        query = Query(language, query_scm)
+        query = self.language_manager.get_query('ruby', query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -10,7 +10,6 @@ class RustAnalyzer(BaseAnalyzer):
 
     def extract_symbols(self, root_node: Node, file_path: str) -> List[Symbol]:
         symbols = []
-        language = self.language_manager.get_language('rust')
 
         query_scm = """
         (function_item
@@ -22,7 +21,7 @@ class RustAnalyzer(BaseAnalyzer):
         (trait_item
           name: (type_identifier) @trait.name) @trait.def
         """
-        query = Query(language, query_scm)
+        query = self.language_manager.get_query('rust', query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -53,7 +52,6 @@ class RustAnalyzer(BaseAnalyzer):
 
     def get_call_graph(self, root_node: Node, file_path: str) -> CallGraph:
         nodes = []
-        language = self.language_manager.get_language('rust')
 
         func_query_scm = """
         (function_item
@@ -63,7 +61,7 @@ class RustAnalyzer(BaseAnalyzer):
             (function_item
               name: (identifier) @method.name) @method.def))
         """
-        func_query = Query(language, func_query_scm)
+        func_query = self.language_manager.get_query('rust', func_query_scm)
         func_cursor = QueryCursor(func_query)
         func_captures = func_cursor.captures(root_node)
 
@@ -88,7 +86,7 @@ class RustAnalyzer(BaseAnalyzer):
                   function: (scoped_identifier
                     name: (identifier) @call.scoped))
                 """
-                call_query = Query(language, call_query_scm)
+                call_query = self.language_manager.get_query('rust', call_query_scm)
                 call_cursor = QueryCursor(call_query)
                 call_captures = call_cursor.captures(func_node)
 
@@ -106,7 +104,6 @@ class RustAnalyzer(BaseAnalyzer):
 
     def find_function(self, root_node: Node, file_path: str, name: str) -> SearchResult:
         matches = []
-        language = self.language_manager.get_language('rust')
 
         query_scm = """
         (function_item
@@ -114,7 +111,7 @@ class RustAnalyzer(BaseAnalyzer):
           (#eq? @function.name "{name}")) @function.def
         """.format(name=name)
 
-        query = Query(language, query_scm)
+        query = Query(self.language_manager.get_language('rust'), query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -128,7 +125,6 @@ class RustAnalyzer(BaseAnalyzer):
 
     def find_variable(self, root_node: Node, file_path: str, name: str) -> SearchResult:
         matches = []
-        language = self.language_manager.get_language('rust')
 
         query_scm = """
         (let_declaration
@@ -139,7 +135,7 @@ class RustAnalyzer(BaseAnalyzer):
           (#eq? @var.name "{name}")) @var.def
         (identifier) @var.use
         """
-        query = Query(language, query_scm.format(name=name))
+        query = Query(self.language_manager.get_language('rust'), query_scm.format(name=name))
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -155,31 +151,8 @@ class RustAnalyzer(BaseAnalyzer):
 
         return SearchResult(query=name, matches=matches)
 
-    def find_usage(self, root_node: Node, file_path: str, name: str) -> SearchResult:
-        matches = []
-        language = self.language_manager.get_language('rust')
-
-        query_scm = """
-        (identifier) @usage
-        """
-
-        query = Query(language, query_scm)
-        cursor = QueryCursor(query)
-        captures = cursor.captures(root_node)
-
-        for _, nodes in captures.items():
-            for node in nodes:
-                if node.text.decode('utf8') != name:
-                    continue
-                start = Point(row=node.start_point[0], column=node.start_point[1])
-                end = Point(row=node.end_point[0], column=node.end_point[1])
-                matches.append(Symbol(name=name, kind='usage', location={'start': start, 'end': end}, file_path=file_path))
-
-        return SearchResult(query=name, matches=matches)
-
     def get_dependencies(self, root_node: Node, file_path: str) -> List[str]:
         dependencies = []
-        language = self.language_manager.get_language('rust')
 
         query_scm = """
         (use_declaration
@@ -200,7 +173,7 @@ class RustAnalyzer(BaseAnalyzer):
           name: (identifier) @extern.name)
         """
 
-        query = Query(language, query_scm)
+        query = self.language_manager.get_query('rust', query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
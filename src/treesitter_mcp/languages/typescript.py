@@ -10,7 +10,6 @@ class TypeScriptAnalyzer(BaseAnalyzer):
 
     def extract_symbols(self, root_node: Node, file_path: str) -> List[Symbol]:
         symbols = []
-        language = self.language_manager.get_language('typescript')
 
         query_scm = """
         (function_declaration
@@ -24,7 +23,7 @@ class TypeScriptAnalyzer(BaseAnalyzer):
         (method_definition
           name: (property_identifier) @method.name) @method.def
         """
-        query = Query(language, query_scm)
+        query = self.language_manager.get_query('typescript', query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -57,7 +56,6 @@ class TypeScriptAnalyzer(BaseAnalyzer):
 
     def get_call_graph(self, root_node: Node, file_path: str) -> CallGraph:
         nodes = []
-        language = self.language_manager.get_language('typescript')
 
         func_query_scm = """
         (function_declaration
@@ -65,7 +63,7 @@ class TypeScriptAnalyzer(BaseAnalyzer):
         (method_definition
           name: (property_identifier) @method.name) @method.def
         """
-        func_query = Query(language, func_query_scm)
+        func_query = self.language_manager.get_query('typescript', func_query_scm)
         func_cursor = QueryCursor(func_query)
         func_captures = func_cursor.captures(root_node)
 
@@ -87,7 +85,7 @@ class TypeScriptAnalyzer(BaseAnalyzer):
                   function: (member_expression
                     property: (property_identifier) @call.method))
                 """
-                call_query = Query(language, call_query_scm)
+                call_query = self.language_manager.get_query('typescript', call_query_scm)
                 call_cursor = QueryCursor(call_query)
                 call_captures = call_cursor.captures(func_node)
 
@@ -105,7 +103,6 @@ class TypeScriptAnalyzer(BaseAnalyzer):
 
     def find_function(self, root_node: Node, file_path: str, name: str) -> SearchResult:
         matches = []
-        language = self.language_manager.get_language('typescript')
 
         query_scm = """
         (function_declaration
@@ -116,7 +113,7 @@ class TypeScriptAnalyzer(BaseAnalyzer):
           (#eq? @method.name "{name}")) @method.def
         """.format(name=name)
 
-        query = Query(language, query_scm)
+        query = Query(self.language_manager.get_language('typescript'), query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -130,7 +127,6 @@ class TypeScriptAnalyzer(BaseAnalyzer):
 
     def find_variable(self, root_node: Node, file_path: str, name: str) -> SearchResult:
         matches = []
-        language = self.language_manager.get_language('typescript')
 
         query_scm = """
         (lexical_declaration
@@ -148,7 +144,7 @@ class TypeScriptAnalyzer(BaseAnalyzer):
           (#eq? @var.name "{name}")) @var.use
         """.format(name=name)
 
-        query = Query(language, query_scm)
+        query = Query(self.language_manager.get_language('typescript'), query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
@@ -161,31 +157,8 @@ class TypeScriptAnalyzer(BaseAnalyzer):
 
         return SearchResult(query=name, matches=matches)
 
-    def find_usage(self, root_node: Node, file_path: str, name: str) -> SearchResult:
-        matches = []
-        language = self.language_manager.get_language('typescript')
-
-        query_scm = """
-        (identifier) @usage
-        """
-
-        query = Query(language, query_scm)
-        cursor = QueryCursor(query)
-        captures = cursor.captures(root_node)
-
-        for _, nodes in captures.items():
-            for node in nodes:
-                if node.text.decode('utf8') != name:
-                    continue
-                start = Point(row=node.start_point[0], column=node.start_point[1])
-                end = Point(row=node.end_point[0], column=node.end_point[1])
-                matches.append(Symbol(name=name, kind='usage', location={'start': start, 'end': end}, file_path=file_path))
-
-        return SearchResult(query=name, matches=matches)
-
     def get_dependencies(self, root_node: Node, file_path: str) -> List[str]:
         dependencies = []
-        language = self.language_manager.get_language('typescript')
 
         query_scm = """
         (import_statement
@@ -199,7 +172,7 @@ class TypeScriptAnalyzer(BaseAnalyzer):
           (#eq? @require.name "require"))
         """
 
-        query = Query(language, query_scm)
+        query = self.language_manager.get_query('typescript', query_scm)
         cursor = QueryCursor(query)
         captures = cursor.captures(root_node)
 
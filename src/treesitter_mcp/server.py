@@ -11,59 +11,95 @@ from .languages.go import GoAnalyzer
 from .languages.java import JavaAnalyzer
 from .languages.ruby import RubyAnalyzer
 
+import logging
 import os
 import sys
 from typing import Any, Optional
 import orjson
 
+log = logging.getLogger("treesitter_mcp")
+_log_level = os.environ.get("TREESITTER_MCP_LOG", "WARNING").upper()
+log.setLevel(
+    _log_level if isinstance(logging.getLevelName(_log_level), int) else "WARNING"
+)
+
 mcp = FastMCP("tree-sitter-analysis")
 language_manager = LanguageManager()
 
-analyzers = {
-    "python": PythonAnalyzer(language_manager),
-    "c": CAnalyzer(language_manager),
-    "cpp": CppAnalyzer(language_manager),
-    "javascript": JavaScriptAnalyzer(language_manager),
-    "php": PhpAnalyzer(language_manager),
-    "rust": RustAnalyzer(language_manager),
-    "typescript": TypeScriptAnalyzer(language_manager),
-    "go": GoAnalyzer(language_manager),
-    "java": JavaAnalyzer(language_manager),
-    "ruby": RubyAnalyzer(language_manager),
+_ANALYZER_CLASSES = {
+    "python": PythonAnalyzer,
+    "c": CAnalyzer,
+    "cpp": CppAnalyzer,
+    "javascript": JavaScriptAnalyzer,
+    "php": PhpAnalyzer,
+    "rust": RustAnalyzer,
+    "typescript": TypeScriptAnalyzer,
+    "go": GoAnalyzer,
+    "java": JavaAnalyzer,
+    "ruby": RubyAnalyzer,
+}
+
+_EXT_TO_LANGUAGE = {
+    ".py": "python",
+    ".c": "c",
+    ".cpp": "cpp",
+    ".cc": "cpp",
+    ".cxx": "cpp",
+    ".h": "cpp",
+    ".hpp": "cpp",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".mjs": "javascript",
+    ".cjs": "javascript",
+    ".php": "php",
+    ".phtml": "php",
+    ".rs": "rust",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".cts": "typescript",
+    ".mts": "typescript",
+    ".go": "go",
+    ".java": "java",
+    ".rb": "ruby",
 }
+_analyzer_instances: dict = {}
+
+
+def get_analyzer_for_language(language: str):
+    """Return the shared analyzer for a language, creating it on first use.
+
+    Args:
+        language: Language name (e.g., 'python', 'cpp')
+
+    Returns:
+        Analyzer instance or None if not supported
+    """
+    analyzer = _analyzer_instances.get(language)
+    if analyzer is None:
+        analyzer_cls = _ANALYZER_CLASSES.get(language)
+        if analyzer_cls is None:
+            return None
+        analyzer = _analyzer_instances.setdefault(
+            language, analyzer_cls(language_manager)
+        )
+    return analyzer
 
 
 def get_analyzer(file_path: str):
     """Determine the appropriate analyzer for a given file path based on extension.
 
+    Extensions are matched case-insensitively.
+
     Args:
         file_path: path to the file
 
     Returns:
         Analyzer instance or None if not supported
     """
-    ext = os.path.splitext(file_path)[1]
-    if ext == ".py":
-        return analyzers["python"]
-    elif ext == ".c":
-        return analyzers["c"]
-    elif ext in (".cpp", ".cc", ".cxx", ".h", ".hpp"):
-        return analyzers["cpp"]
-    elif ext in (".js", ".jsx", ".mjs", ".cjs"):
-        return analyzers["javascript"]
-    elif ext in (".php", ".phtml"):
-        return analyzers["php"]
-    elif ext == ".rs":
-        return analyzers["rust"]
-    elif ext in (".ts", ".tsx", ".cts", ".mts"):
-        return analyzers["typescript"]
-    elif ext == ".go":
-        return analyzers["go"]
-    elif ext == ".java":
-        return analyzers["java"]
-    elif ext == ".rb":
-        return analyzers["ruby"]
-    return None
+    language = _EXT_TO_LANGUAGE.get(os.path.splitext(file_path)[1].lower())
+    if language is None:
+        return None
+    return get_analyzer_for_language(language)
 
 
 def normalize_path(file_path: str) -> str:
@@ -88,7 +124,7 @@ def write_output_file(output_file: str, data: Any) -> dict:
         parent_dir = os.path.dirname(output_path)
 
         if os.path.exists(output_path):
-            print(f"Warning: Overwriting existing file: {output_path}", file=sys.stderr)
+            log.warning("Overwriting existing file: %s", output_path)
 
         if parent_dir:
             os.makedirs(parent_dir, exist_ok=True)
@@ -139,13 +175,58 @@ def treesitter_analyze_file(file_path: str, output_file: Optional[str] = None) -
         if not analyzer:
             return {"error": f"Unsupported file type: {file_path}"}
 
-        with open(file_path, "r") as f:
-            code = f.read()
+        code, tree = language_manager.get_tree(
+            file_path, analyzer.get_language_name()
+        )
 
-        result = analyzer.analyze(file_path, code)
-        result_dict = result.model_dump()
+        result = analyzer.analyze_symbols_only(file_path, code, tree=tree)
+        result_dict = result.model_dump(exclude={"ast"})
 
-        result_dict.pop("ast", None)
+        if output_file:
+            return write_output_file(output_file, result_dict)
+        return result_dict
+    except Exception as e:
+        return {"error": f"Error analyzing file: {str(e)}"}
+
+
+def treesitter_analyze_full(file_path: str, output_file: Optional[str] = None) -> Any:
+    """Return symbols, call graph and dependencies of a file as one aggregate.
+
+    Returns the same data as treesitter_analyze_file, treesitter_get_call_graph
+    and treesitter_get_dependencies together; the analyses still run as
+    separate passes. All four tools share a per-file cache, so parts already
+    computed for the unchanged file are reused.
+
+    Args:
+        file_path: Path to the source code file
+        output_file: If provided, writes result to this file instead of returning.
+                     Useful for large outputs to prevent context overload.
+
+    Returns:
+        Dictionary containing:
+        - file_path: The analyzed file path
+        - language: Detected programming language
+        - symbols: List of extracted symbols (functions, classes, etc.)
+        - call_graph: Call graph with a "nodes" list (see treesitter_get_call_graph)
+        - dependencies: List of dependency strings (see treesitter_get_dependencies)
+        OR if output_file is set: {"status": "written", "output_file": "...", "bytes_written": N}
+    """
+
+    try:
+        file_path = normalize_path(file_path)
+        if not os.path.exists(file_path):
+            return {"error": f"File not found: {file_path}"}
+
+        analyzer = get_analyzer(file_path)
+        if not analyzer:
+            return {"error": f"Unsupported file type: {file_path}"}
+
+        code, tree = language_manager.get_tree(
+            file_path, analyzer.get_language_name()
+        )
+
+        result = analyzer.analyze_full(tree.root_node, file_path)
+        result_dict = result.model_dump()
 
         if output_file:
             return write_output_file(output_file, result_dict)
@@ -180,12 +261,12 @@ def treesitter_get_call_graph(file_path: str, output_file: Optional[str] = None)
         if not analyzer:
             return {"error": f"Unsupported file type: {file_path}"}
 
-        with open(file_path, "r") as f:
-            code = f.read()
+        code, tree = language_manager.get_tree(
+            file_path, analyzer.get_language_name()
+        )
 
-        tree = analyzer.parse(code)
         if hasattr(analyzer, "get_call_graph"):
-            result = analyzer.get_call_graph(tree.root_node, file_path)
+            result = analyzer.cached_call_graph(tree.root_node, file_path)
             result_dict = result.model_dump()
 
             if output_file:
@@ -229,10 +310,10 @@ def treesitter_find_function(
         if not analyzer:
             return {"error": f"Unsupported file type: {file_path}"}
 
-        with open(file_path, "r") as f:
-            code = f.read()
+        code, tree = language_manager.get_tree(
+            file_path, analyzer.get_language_name()
+        )
 
-        tree = analyzer.parse(code)
         if hasattr(analyzer, "find_function"):
             result = analyzer.find_function(tree.root_node, file_path, name)
             result_dict = result.model_dump()
@@ -291,10 +372,10 @@ def treesitter_find_variable(
         if not analyzer:
             return {"error": f"Unsupported file type: {file_path}"}
 
-        with open(file_path, "r") as f:
-            code = f.read()
+        code, tree = language_manager.get_tree(
+            file_path, analyzer.get_language_name()
+        )
 
-        tree = analyzer.parse(code)
         if hasattr(analyzer, "find_variable"):
             result = analyzer.find_variable(tree.root_node, file_path, name)
             result_dict = result.model_dump()
@@ -334,7 +415,7 @@ def treesitter_get_supported_languages(output_file: Optional[str] = None) -> Any
     """
 
     try:
-        result = list(analyzers.keys())
+        result = list(_ANALYZER_CLASSES.keys())
         if output_file:
             return write_output_file(output_file, result)
         return result
@@ -359,9 +440,10 @@ def treesitter_get_ast(
         - type: Node type (e.g., 'module', 'function_definition')
         - start_point: Starting position (row, column)
         - end_point: Ending position (row, column)
-        - children: List of child AST nodes
-        - text: Optional text content
-        - id: Optional node identifier
+        - children: List of child AST nodes (omitted for leaves)
+        - field_name: Field name within the parent (omitted if none)
+        - text: Source text of leaf nodes (omitted otherwise)
+        - id: Node identifier
         OR if output_file is set: {"status": "written", "output_file": "...", "bytes_written": N}
     """
 
@@ -374,12 +456,12 @@ def treesitter_get_ast(
         if not analyzer:
             return {"error": f"Unsupported file type: {file_path}"}
 
-        with open(file_path, "r") as f:
-            code = f.read()
+        code, tree = language_manager.get_tree(
+            file_path, analyzer.get_language_name()
+        )
 
-        tree = analyzer.parse(code)
         ast = analyzer._build_ast(tree.root_node, code, max_depth=max_depth)
-        result_dict = ast.model_dump()
+        result_dict = ast.to_dict()
 
         if output_file:
             return write_output_file(output_file, result_dict)
@@ -418,11 +500,12 @@ def treesitter_get_node_at_point(
         if not analyzer:
             return {"error": f"Unsupported file type: {file_path}"}
 
-        with open(file_path, "r") as f:
-            code = f.read()
+        code, tree = language_manager.get_tree(
+            file_path, analyzer.get_language_name()
+        )
 
         ast = analyzer.build_node_at_point(
-            code, row=row, column=column, max_depth=max_depth
+            code, row=row, column=column, max_depth=max_depth, tree=tree
         )
         result_dict = ast.model_dump()
         if output_file:
@@ -466,8 +549,9 @@ def treesitter_get_node_for_range(
         if not analyzer:
             return {"error": f"Unsupported file type: {file_path}"}
 
-        with open(file_path, "r") as f:
-            code = f.read()
+        code, tree = language_manager.get_tree(
+            file_path, analyzer.get_language_name()
+        )
 
         ast = analyzer.build_node_for_range(
             code,
@@ -476,6 +560,7 @@ def treesitter_get_node_for_range(
             end_row=end_row,
             end_col=end_column,
             max_depth=max_depth,
+            tree=tree,
         )
         result_dict = ast.model_dump()
         if output_file:
@@ -515,11 +600,12 @@ def treesitter_cursor_walk(
         if not analyzer:
             return {"error": f"Unsupported file type: {file_path}"}
 
-        with open(file_path, "r") as f:
-            code = f.read()
+        code, tree = language_manager.get_tree(
+            file_path, analyzer.get_language_name()
+        )
 
         result = analyzer.build_cursor_view(
-            code, row=row, column=column, max_depth=max_depth
+            code, row=row, column=column, max_depth=max_depth, tree=tree
         )
         if output_file:
             return write_output_file(output_file, result)
@@ -563,8 +649,9 @@ def treesitter_get_source_for_range(
         if not analyzer:
             return {"error": f"Unsupported file type: {file_path}"}
 
-        with open(file_path, "r") as f:
-            code = f.read()
+        code, tree = language_manager.get_tree(
+            file_path, analyzer.get_language_name()
+        )
 
         source = analyzer.get_source_for_range(
             code,
@@ -614,14 +701,19 @@ def treesitter_run_query(
         if not os.path.exists(file_path):
             return {"error": f"File not found: {file_path}"}
 
-        analyzer = get_analyzer(file_path)
-        if not analyzer:
-            return {"error": f"Unsupported file type: {file_path}"}
+        if language:
+            analyzer = get_analyzer_for_language(language)
+            if not analyzer:
+                return {"error": f"Unsupported language: {language}"}
+        else:
+            analyzer = get_analyzer(file_path)
+            if not analyzer:
+                return {"error": f"Unsupported file type: {file_path}"}
 
-        with open(file_path, "r") as f:
-            code = f.read()
+        code, tree = language_manager.get_tree(
+            file_path, analyzer.get_language_name()
+        )
 
-        tree = analyzer.parse(code)
         results = analyzer.run_query(query, tree.root_node, code)
 
         if output_file:
@@ -662,10 +754,10 @@ def treesitter_find_usage(
         if not analyzer:
             return {"error": f"Unsupported file type: {file_path}"}
 
-        with open(file_path, "r") as f:
-            code = f.read()
+        code, tree = language_manager.get_tree(
+            file_path, analyzer.get_language_name()
+        )
 
-        tree = analyzer.parse(code)
         result = analyzer.find_usage(tree.root_node, file_path, name)
         result_dict = result.model_dump()
 
@@ -702,11 +794,11 @@ def treesitter_get_dependencies(
         if not analyzer:
             return {"error": f"Unsupported file type: {file_path}"}
 
-        with open(file_path, "r") as f:
-            code = f.read()
+        code, tree = language_manager.get_tree(
+            file_path, analyzer.get_language_name()
+        )
 
-        tree = analyzer.parse(code)
-        dependencies = analyzer.get_dependencies(tree.root_node, file_path)
+        dependencies = analyzer.cached_dependencies(tree.root_node, file_path)
 
         if output_file:
             return write_output_file(output_file, dependencies)
@@ -718,6 +810,7 @@ def treesitter_get_dependencies(
 # Map of all available tools - used for dynamic registration
 ALL_TOOLS = {
     "treesitter_analyze_file": treesitter_analyze_file,
+    "treesitter_analyze_full": treesitter_analyze_full,
     "treesitter_get_call_graph": treesitter_get_call_graph,
     "treesitter_find_function": treesitter_find_function,
     "treesitter_find_variable": treesitter_find_variable,
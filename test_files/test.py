@@ -0,0 +1,19 @@
+import os
+from collections import OrderedDict
+
+
+def factorial(n):
+    """Compute n! — ünïcode docstring."""
+    if n <= 1:
+        return 1
+    return n * factorial(n - 1)
+
+
+class Greeter:
+    def greet(self, name):
+        message = "héllo " + name
+        print(message)
+        return message
+
+
+result = factorial(5)
@@ -0,0 +1,208 @@
+from pathlib import Path
+import sys
+from typing import Tuple
+
+from tree_sitter import Tree
+
+from treesitter_mcp.core.language_manager import LanguageManager
+from treesitter_mcp.languages.python import PythonAnalyzer
+
+
+SOURCE = 'x = "é"; y = 1\n'.encode("utf-8")
+
+
+def test_source_for_range_uses_byte_columns() -> None:
+    """Slices source by Tree-sitter byte columns, not character indexes.
+
+    Args:
+        None.
+
+    Returns:
+        None.
+    """
+    analyzer = PythonAnalyzer(LanguageManager())
+    tree = analyzer.parse(SOURCE)
+    assignment = tree.root_node.children[0]
+    start, end = assignment.start_point, assignment.end_point
+
+    source = analyzer.get_source_for_range(SOURCE, start[0], start[1], end[0], end[1])
+
+    assert source == 'x = "é"'
+
+
+def test_run_query_text_for_non_ascii_source() -> None:
+    """Returns capture text decoded from the source bytes.
+
+    Args:
+        None.
+
+    Returns:
+        None.
+    """
+    analyzer = PythonAnalyzer(LanguageManager())
+    tree = analyzer.parse(SOURCE)
+
+    results = analyzer.run_query("(string) @str", tree.root_node, SOURCE)
+
+    assert [result["text"] for result in results] == ['"é"']
+
+
+def _cached_tree(tmp_path: Path, text: str) -> Tuple[PythonAnalyzer, str, bytes, Tree]:
+    """Write a Python file and parse it through the tree cache.
+
+    Args:
+        tmp_path: Temporary directory fixture.
+        text: File contents.
+
+    Returns:
+        Tuple of (analyzer, file path, source bytes, cached tree).
+    """
+    source = tmp_path / "sample.py"
+    source.write_text(text)
+    analyzer = PythonAnalyzer(LanguageManager())
+    code, tree = analyzer.language_manager.get_tree(str(source), "python")
+    return analyzer, str(source), code, tree
+
+
+def test_analyze_full_is_cached_per_tree(tmp_path: Path) -> None:
+    """Reuses the combined analysis only for the file's cached tree.
+
+    Args:
+        tmp_path: Temporary directory fixture.
+
+    Returns:
+        None.
+    """
+    analyzer, path, code, tree = _cached_tree(
+        tmp_path, "import os\n\ndef f():\n    g()\n\ndef g():\n    pass\n"
+    )
+
+    result = analyzer.analyze_full(tree.root_node, path)
+    again = analyzer.analyze_full(tree.root_node, path)
+    reparsed = analyzer.analyze_full(analyzer.parse(code).root_node, path)
+
+    assert again is result
+    assert reparsed is not result
+    assert [symbol.name for symbol in result.symbols] == ["f", "g"]
+    assert result.call_graph.nodes[0].calls == ["g"]
+    assert result.dependencies == ["os"]
+
+
+def test_derived_results_are_evicted_with_their_tree(tmp_path: Path) -> None:
+    """Drops per-tree results when the tree cache evicts the file.
+
+    Args:
+        tmp_path: Temporary directory fixture.
+
+    Returns:
+        None.
+    """
+    analyzer, path, _, tree = _cached_tree(tmp_path, "import os\n")
+    manager = analyzer.language_manager
+
+    result = analyzer.analyze_full(tree.root_node, path)
+    assert manager.get_derived_results(path, "python", tree.root_node)
+
+    manager._tree_cache.clear()
+
+    assert manager.get_derived_results(path, "python", tree.root_node) is None
+    assert analyzer.analyze_full(tree.root_node, path) is not result
+
+
+def test_individual_analyses_share_the_full_analysis_cache(tmp_path: Path) -> None:
+    """Computes each analysis once across the single tools and analyze_full.
+
+    Args:
+        tmp_path: Temporary directory fixture.
+
+    Returns:
+        None.
+    """
+    analyzer, path, code, tree = _cached_tree(
+        tmp_path, "import os\n\ndef f():\n    g()\n\ndef g():\n    pass\n"
+    )
+    root = tree.root_node
+    calls = []
+    for method in ("extract_symbols", "get_call_graph", "get_dependencies"):
+        original = getattr(analyzer, method)
+
+        def counted(*args, _original=original, _method=method):
+            calls.append(_method)
+            return _original(*args)
+
+        setattr(analyzer, method, counted)
+
+    analyzer.analyze_symbols_only(path, code, tree=tree)
+    call_graph = analyzer.cached_call_graph(root, path)
+    dependencies = analyzer.cached_dependencies(root, path)
+    analyzer.analyze_full(root, path)
+    analyzer.cached_dependencies(root, path)
+
+    assert sorted(calls) == ["extract_symbols", "get_call_graph", "get_dependencies"]
+    assert call_graph.nodes[0].calls == ["g"]
+    assert dependencies == ["os"]
+
+
+def test_find_usage_uses_cached_identifier_index(tmp_path: Path) -> None:
+    """Answers repeated lookups from one identifier index per tree.
+
+    Args:
+        tmp_path: Temporary directory fixture.
+
+    Returns:
+        None.
+    """
+    analyzer, path, _, tree = _cached_tree(tmp_path, "a = 1\nb = a + a\nprint(b)\n")
+    root = tree.root_node
+
+    usages_a = analyzer.find_usage(root, path, "a")
+    usages_b = analyzer.find_usage(root, path, "b")
+    index = analyzer._get_identifier_index(root, path)
+
+    assert [m.location["start"].column for m in usages_a.matches] == [0, 4, 8]
+    assert [m.location["start"].row for m in usages_b.matches] == [1, 2]
+    assert analyzer._get_identifier_index(root, path) is index
+
+
+def test_find_usage_matches_non_ascii_names() -> None:
+    """Finds identifiers containing multi-byte characters.
+
+    Args:
+        None.
+
+    Returns:
+        None.
+    """
+    analyzer = PythonAnalyzer(LanguageManager())
+    code = "café = 1\nprint(café)\n".encode("utf-8")
+    root = analyzer.parse(code).root_node
+
+    usages = analyzer.find_usage(root, "sample.py", "café")
+
+    assert [m.location["start"].row for m in usages.matches] == [0, 1]
+    assert all(m.name == "café" for m in usages.matches)
+
+
+def test_build_ast_handles_nesting_deeper_than_recursion_limit() -> None:
+    """Builds and serializes an AST deeper than Python's recursion limit.
+
+    Args:
+        None.
+
+    Returns:
+        None.
+    """
+    depth = sys.getrecursionlimit() + 500
+    code = b"x = " + b"[" * depth + b"]" * depth + b"\n"
+    analyzer = PythonAnalyzer(LanguageManager())
+    tree = analyzer.parse(code)
+
+    ast = analyzer._build_ast(tree.root_node, code).to_dict()
+
+    levels = 0
+    pending = [(ast, 0)]
+    while pending:
+        node, level = pending.pop()
+        levels = max(levels, level)
+        pending.extend((child, level + 1) for child in node.get("children", []))
+    assert levels > depth
@@ -0,0 +1,182 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import os
+
+from treesitter_mcp.core.language_manager import (
+    LanguageManager,
+    TreeCache,
+    compute_edit,
+)
+
+
+def _write(path: Path, text: str, mtime_ns: int) -> None:
+    """Write a file and pin its modification time.
+
+    Args:
+        path: File to write.
+        text: File contents.
+        mtime_ns: Modification time to set, in nanoseconds.
+
+    Returns:
+        None.
+    """
+    path.write_text(text)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_get_tree_reuses_cached_tree(tmp_path: Path) -> None:
+    """Returns the same tree while the file is unchanged.
+
+    Args:
+        tmp_path: Temporary directory fixture.
+
+    Returns:
+        None.
+    """
+    source = tmp_path / "sample.py"
+    _write(source, "def foo():\n    return 1\n", 1_000_000_000)
+    manager = LanguageManager()
+
+    code, tree = manager.get_tree(str(source), "python")
+    cached_code, cached_tree = manager.get_tree(str(source), "python")
+
+    assert code == b"def foo():\n    return 1\n"
+    assert cached_code is code
+    assert cached_tree is tree
+
+
+def test_get_tree_reparses_modified_file(tmp_path: Path) -> None:
+    """Reparses when the file's mtime or size changes.
+
+    Args:
+        tmp_path: Temporary directory fixture.
+
+    Returns:
+        None.
+    """
+    source = tmp_path / "sample.py"
+    _write(source, "def foo():\n    return 1\n", 1_000_000_000)
+    manager = LanguageManager()
+
+    _, tree = manager.get_tree(str(source), "python")
+    _write(source, "def bar():\n    return 22\n", 2_000_000_000)
+    code, new_tree = manager.get_tree(str(source), "python")
+
+    assert code == b"def bar():\n    return 22\n"
+    assert new_tree is not tree
+    assert b"bar" in new_tree.root_node.text
+
+
+def test_tree_cache_evicts_least_recently_used() -> None:
+    """Evicts the oldest entry once capacity is exceeded.
+
+    Args:
+        None.
+
+    Returns:
+        None.
+    """
+    cache = TreeCache(capacity=2)
+    cache.put(("a", "python"), 1, 1, b"a", None)
+    cache.put(("b", "python"), 1, 1, b"b", None)
+    cache.get(("a", "python"), 1, 1)
+    cache.put(("c", "python"), 1, 1, b"c", None)
+
+    assert cache.get(("a", "python"), 1, 1) is not None
+    assert cache.get(("b", "python"), 1, 1) is None
+    assert cache.get(("c", "python"), 1, 1) is not None
+
+
+def test_get_tree_incremental_reparse_matches_full_parse(tmp_path: Path) -> None:
+    """Produces the same tree as a fresh parse after an in-place edit.
+
+    Args:
+        tmp_path: Temporary directory fixture.
+
+    Returns:
+        None.
+    """
+    source = tmp_path / "sample.py"
+    _write(source, "def foo():\n    return 1\n\n\ndef bar():\n    pass\n", 1_000_000_000)
+    manager = LanguageManager()
+    manager.get_tree(str(source), "python")
+
+    updated = "def foo():\n    x = 'é'\n    return x\n\n\ndef bar():\n    pass\n"
+    _write(source, updated, 2_000_000_000)
+    code, tree = manager.get_tree(str(source), "python")
+
+    fresh = LanguageManager().get_parser("python").parse(code)
+    assert str(tree.root_node) == str(fresh.root_node)
+    assert tree.root_node.end_point == fresh.root_node.end_point
+
+
+def test_compute_edit_single_range() -> None:
+    """Describes a replacement by its byte offsets and points.
+
+    Args:
+        None.
+
+    Returns:
+        None.
+    """
+    edit = compute_edit(b"ab\ncd\nef", b"ab\nXYZ\nef")
+
+    assert edit == {
+        "start_byte": 3,
+        "old_end_byte": 5,
+        "new_end_byte": 6,
+        "start_point": (1, 0),
+        "old_end_point": (1, 2),
+        "new_end_point": (1, 3),
+    }
+    assert compute_edit(b"same", b"same") is None
+
+
+def test_compute_edit_past_first_chunk() -> None:
+    """Locates edits beyond the first scan chunk on multi-line sources.
+
+    Args:
+        None.
+
+    Returns:
+        None.
+    """
+    old = b"x = 1\n" * 2000
+    new = old[:9001] + b"yy\nz" + old[9003:]
+
+    edit = compute_edit(old, new)
+
+    assert edit["start_byte"] == 9001
+    assert edit["old_end_byte"] == 9003
+    assert edit["new_end_byte"] == 9005
+    assert edit["start_point"] == (1500, 1)
+    assert edit["old_end_point"] == (1500, 3)
+    assert edit["new_end_point"] == (1501, 1)
+
+
+def test_get_tree_concurrent_threads(tmp_path: Path) -> None:
+    """Serves parallel callers from a small shared cache without errors.
+
+    Args:
+        tmp_path: Temporary directory fixture.
+
+    Returns:
+        None.
+    """
+    paths = []
+    for idx in range(6):
+        source = tmp_path / f"sample_{idx}.py"
+        _write(source, f"def f{idx}():\n    return {idx}\n", 1_000_000_000)
+        paths.append(str(source))
+    manager = LanguageManager()
+    manager._tree_cache = TreeCache(capacity=2)
+
+    def parse(path: str) -> bytes:
+        code, tree = manager.get_tree(path, "python")
+        assert tree.root_node.type == "module"
+        return code
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(parse, paths * 50))
+
+    assert results[:6] == [Path(path).read_bytes() for path in paths]
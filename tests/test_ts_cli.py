@@ -5,6 +5,9 @@ from pathlib import Path
 import subprocess
 import sys
 
+from treesitter_mcp.cli.ts_cli import _analyze_directory
+from treesitter_mcp.server import language_manager
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 CLI_MODULE = "treesitter_mcp.cli.ts_cli"
@@ -152,3 +155,47 @@ def test_ts_cli_output_file(tmp_path: Path) -> None:
     assert output_path.exists()
     output_payload = json.loads(output_path.read_text())
     assert output_payload["type"] == "module"
+
+
+def test_ts_cli_directory_recursive(tmp_path: Path) -> None:
+    """Analyzes every supported file below a directory in parallel.
+
+    Args:
+        tmp_path: Temporary directory fixture.
+
+    Returns:
+        None.
+    """
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "top.py").write_text("def top():\n    pass\n")
+    (tmp_path / "nested" / "inner.c").write_text("int inner(void) { return 0; }\n")
+    (tmp_path / "notes.txt").write_text("not source\n")
+
+    flat = _run_cli([str(tmp_path), "--jobs", "2"])
+    nested = _run_cli([str(tmp_path), "--recursive", "--jobs", "2"])
+
+    assert flat.returncode == 0, flat.stderr
+    assert nested.returncode == 0, nested.stderr
+    assert [item["language"] for item in _load_json(flat)] == ["python"]
+    payload = _load_json(nested)
+    assert [item["language"] for item in payload] == ["c", "python"]
+    assert payload[0]["symbols"][0]["name"] == "inner"
+
+
+def test_ts_cli_directory_mode_leaves_caches_empty(tmp_path: Path) -> None:
+    """Keeps batch-analyzed files out of the server's per-file caches.
+
+    Args:
+        tmp_path: Temporary directory fixture.
+
+    Returns:
+        None.
+    """
+    for idx in range(3):
+        (tmp_path / f"mod_{idx}.py").write_text(f"def f{idx}():\n    pass\n")
+    language_manager._tree_cache.clear()
+
+    results = _analyze_directory(str(tmp_path), jobs=2)
+
+    assert [item["symbols"][0]["name"] for item in results] == ["f0", "f1", "f2"]
+    assert len(language_manager._tree_cache._entries) == 0